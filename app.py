@@ -8,18 +8,16 @@ It initializes the Qt application, sets up logging, and launches the main window
 
 import sys
 import os
+import time
 import logging
 from pathlib import Path
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
 
 # Add the project root to Python path for imports
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from gui.main_window import MainWindow
-from config.app_config import config
+# Qt, the GUI package and the config module are imported inside the functions
+# that need them so that the module itself stays cheap to import.
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -27,6 +25,10 @@ logger = logging.getLogger(__name__)
 
 def setup_application():
     """Setup the Qt application with proper configuration."""
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QIcon
+    
     # Enable high DPI scaling
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
@@ -53,7 +55,12 @@ def setup_application():
 
 
 def check_dependencies():
-    """Check for required dependencies and display warnings if missing."""
+    """
+    Check for required local dependencies and collect warnings if missing.
+    
+    The Ollama service is probed separately by start_service_probe() so that
+    a slow or absent service does not delay showing the main window.
+    """
     missing_deps = []
     warnings = []
     
@@ -67,25 +74,37 @@ def check_dependencies():
             "Run 'python setup.py build_ext --inplace' to build it for better performance."
         )
     
-    # Check for Ollama connection
-    try:
-        import requests
-        response = requests.get(config.ollama_api_url.replace('/api/chat', '/api/tags'), timeout=2)
-        if response.status_code == 200:
-            logger.info("Ollama service is available")
-        else:
-            warnings.append("Ollama service is not responding properly")
-    except Exception:
-        warnings.append(
-            "Could not connect to Ollama service. "
-            "Please ensure Ollama is installed and running with 'ollama run qwen2.5-coder'"
-        )
-    
     return missing_deps, warnings
 
 
+def start_service_probe(warnings):
+    """
+    Probe the Ollama service in the background.
+    
+    Args:
+        warnings: Warnings already collected by check_dependencies()
+        
+    Returns:
+        OllamaProbeTask: The submitted task; the caller must keep a reference
+        to it until the probe has reported back.
+    """
+    from PyQt6.QtCore import QThreadPool
+    from llm_interface.service_probe import OllamaProbeTask
+    
+    task = OllamaProbeTask()
+    task.setAutoDelete(False)
+    task.signals.finished.connect(
+        lambda service_warnings: show_startup_info(warnings + service_warnings)
+    )
+    QThreadPool.globalInstance().start(task)
+    
+    return task
+
+
 def show_startup_info(warnings):
     """Show startup information and warnings to the user."""
+    from PyQt6.QtWidgets import QMessageBox
+    
     if warnings:
         message = "Code Review Assistant is starting with the following notices:\n\n"
         message += "\n".join(f"• {warning}" for warning in warnings)
@@ -112,6 +131,7 @@ def handle_exception(exc_type, exc_value, exc_traceback):
     )
     
     # Show error dialog to user
+    from PyQt6.QtWidgets import QMessageBox
     error_msg = f"An unexpected error occurred:\n\n{exc_type.__name__}: {exc_value}"
     QMessageBox.critical(None, "Critical Error", error_msg)
 
@@ -126,12 +146,18 @@ def main():
     # Setup error handling first
     setup_error_handling()
     
+    # Importing the config also configures logging
+    from config.app_config import config
+    
     logger.info("Starting Code Review Assistant v2.0.0")
     
     try:
         # Create Qt application
         app = setup_application()
         
+        from PyQt6.QtWidgets import QMessageBox
+        from gui.main_window import MainWindow
+        
         # Check dependencies
         missing_deps, warnings = check_dependencies()
         
@@ -143,13 +169,16 @@ def main():
             QMessageBox.critical(None, "Missing Dependencies", error_msg)
             return 1
         
-        # Show warnings if any
-        if warnings:
-            show_startup_info(warnings)
-        
         # Create and show main window
+        t0 = time.perf_counter()
         main_window = MainWindow()
         main_window.show()
+        logger.info("MainWindow constructed and shown in %.1f ms",
+                    (time.perf_counter() - t0) * 1000)
+        
+        # Probe the LLM service once the window is visible; warnings are
+        # shown when the probe reports back
+        service_probe = start_service_probe(warnings)
         
         logger.info("Application started successfully")
         
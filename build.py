@@ -72,27 +72,68 @@ def check_requirements():
     return True
 
 def install_python_dependencies():
-    """Install Python dependencies."""
+    """
+    Install Python dependencies.
+    
+    Wheels are built into .wheels/ and installed from there, and a stamp
+    keyed by the hash of requirements.txt and the target interpreter skips
+    the step entirely when neither has changed since the last successful
+    install.
+    """
     print_header("Installing Python Dependencies")
     
-    if not run_command([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt']):
+    import hashlib
+    # A different interpreter or virtualenv needs its own install
+    req_hash = hashlib.sha256(Path('requirements.txt').read_bytes())
+    req_hash.update(f'{sys.executable}\0{sys.prefix}\0{sys.version}'.encode())
+    cache_dir = Path('.pip-cache')
+    stamp = cache_dir / f'.installed-{req_hash.hexdigest()}'
+    
+    if stamp.exists():
+        print("✅ Python dependencies already installed (requirements and interpreter unchanged)")
+        return True
+    
+    pip_cmd = [sys.executable, '-m', 'pip']
+    if not run_command(pip_cmd + ['wheel', '--cache-dir', str(cache_dir),
+                                  '--wheel-dir', '.wheels', '-r', 'requirements.txt']):
+        print("❌ Failed to build Python dependency wheels")
+        return False
+    
+    if not run_command(pip_cmd + ['install', '--no-index', '--find-links', '.wheels',
+                                  '-r', 'requirements.txt']):
         print("❌ Failed to install Python dependencies")
         return False
     
+    cache_dir.mkdir(exist_ok=True)
+    stamp.touch()
+    
     print("✅ Python dependencies installed successfully!")
     return True
 
-def build_cpp_module():
-    """Build the C++ performance module."""
-    print_header("Building C++ Performance Module")
-    
-    # Create build directory
-    build_dir = Path('build')
-    build_dir.mkdir(exist_ok=True)
+def _release_cxx_flags(avx2=False):
+    """
+    Return release-tuning compiler flags for the current platform.
     
-    # Configure with CMake
+    Args:
+        avx2: Whether to target AVX2 on MSVC; the module then fails to load
+            on CPUs without it
+    """
+    if platform.system() == 'Windows':
+        return ['/O2', '/arch:AVX2'] if avx2 else ['/O2']
+    return ['-O3', '-march=native', '-fno-plt']
+
+def _configure_and_build(build_dir, cxx_flags):
+    """Configure and build the C++ module with the given compiler flags."""
     print("Configuring with CMake...")
-    cmake_cmd = ['cmake', '..']
+    cmake_cmd = [
+        'cmake', '..',
+        '-DCMAKE_BUILD_TYPE=Release',
+        '-DCMAKE_INTERPROCEDURAL_OPTIMIZATION=ON',  # LTO (/GL + /LTCG on MSVC)
+        # Appended to CMake's default flags (e.g. /EHsc on MSVC), not
+        # replacing them as CMAKE_CXX_FLAGS would
+        f"-DCORE_EXTRA_CXX_FLAGS={' '.join(cxx_flags)}",
+        f'-DPYTHON_EXECUTABLE={sys.executable}',  # Build for this interpreter
+    ]
     if platform.system() == 'Windows':
         cmake_cmd.extend(['-G', 'Visual Studio 16 2019'])
     
@@ -107,7 +148,10 @@ def build_cpp_module():
         print("❌ C++ module build failed")
         return False
     
-    # Copy the built module to the project root
+    return True
+
+def _copy_built_module(build_dir):
+    """Copy the built module to the project root."""
     if platform.system() == 'Windows':
         module_pattern = 'core_performance*.pyd'
         src_dir = build_dir / 'Release'
@@ -128,6 +172,105 @@ def build_cpp_module():
         shutil.copy2(module, dest)
         print(f"✅ Copied {module} to {dest}")
     
+    return True
+
+def _run_pgo_workload():
+    """Exercise the C++ hot paths to collect profile data."""
+    workload = """
+import os, tempfile
+import core_performance
+fd, path = tempfile.mkstemp(suffix='.py')
+with os.fdopen(fd, 'w') as f:
+    f.write('def f(x):\\n    return x * 2\\n' * 20000)
+try:
+    for _ in range(1000):
+        core_performance.FileProcessor.is_valid_python_file(path)
+        core_performance.FileProcessor.read_file_fast(path)
+    streamer = core_performance.AdaptiveTextStreamer(20, 100)
+    streamer.set_update_callback(lambda text: None)
+    for i in range(100000):
+        streamer.add_token('token ')
+    streamer.flush_buffer()
+finally:
+    os.remove(path)
+"""
+    return run_command([sys.executable, '-c', workload])
+
+def _cxx_compiler_is_clang():
+    """Return True if the C++ compiler CMake will pick up is Clang."""
+    try:
+        result = subprocess.run([os.environ.get('CXX', 'c++'), '--version'],
+                                capture_output=True, text=True)
+    except OSError:
+        return False
+    return 'clang' in result.stdout.lower()
+
+def _merge_clang_profile(profile_dir):
+    """Merge Clang's raw profiles into a single .profdata file."""
+    import shutil
+    
+    if shutil.which('llvm-profdata'):
+        merge_cmd = ['llvm-profdata']
+    elif platform.system() == 'Darwin':
+        merge_cmd = ['xcrun', 'llvm-profdata']
+    else:
+        print("❌ llvm-profdata not found; it is needed for PGO with Clang")
+        return None
+    
+    profdata = profile_dir / 'default.profdata'
+    raw_profiles = [str(p) for p in profile_dir.glob('*.profraw')]
+    if not raw_profiles or not run_command(
+            merge_cmd + ['merge', '-o', str(profdata)] + raw_profiles):
+        return None
+    return profdata
+
+def build_cpp_module(pgo=False, avx2=False):
+    """
+    Build the C++ performance module.
+    
+    Args:
+        pgo: Whether to run a profile-guided optimization build (GCC/Clang)
+        avx2: Whether to target AVX2 on MSVC
+    """
+    print_header("Building C++ Performance Module")
+    
+    # Create build directory
+    build_dir = Path('build')
+    build_dir.mkdir(exist_ok=True)
+    
+    cxx_flags = _release_cxx_flags(avx2)
+    
+    if pgo and platform.system() != 'Windows':
+        import shutil
+        
+        # Stage 1: instrumented build, then run a synthetic workload
+        profile_dir = (build_dir / 'pgo').resolve()
+        shutil.rmtree(profile_dir, ignore_errors=True)  # Drop stale profiles
+        print("Building instrumented module for PGO...")
+        if not (_configure_and_build(build_dir, cxx_flags + [f'-fprofile-generate={profile_dir}'])
+                and _copy_built_module(build_dir)
+                and _run_pgo_workload()):
+            print("❌ PGO profiling run failed")
+            return False
+        
+        # Stage 2: rebuild using the collected profile. GCC reads its .gcda
+        # files directly; Clang needs the raw profiles merged first and
+        # does not accept -fprofile-correction
+        if _cxx_compiler_is_clang():
+            profdata = _merge_clang_profile(profile_dir)
+            if profdata is None:
+                print("❌ Merging the PGO profile failed")
+                return False
+            cxx_flags = cxx_flags + [f'-fprofile-use={profdata}']
+        else:
+            cxx_flags = cxx_flags + [f'-fprofile-use={profile_dir}', '-fprofile-correction']
+    
+    if not _configure_and_build(build_dir, cxx_flags):
+        return False
+    
+    if not _copy_built_module(build_dir):
+        return False
+    
     print("✅ C++ performance module built successfully!")
     return True
 
@@ -142,6 +285,25 @@ def build_with_setup_py():
     print("✅ C++ module built successfully with setup.py!")
     return True
 
+def precompile_bytecode():
+    """Precompile the application's Python sources to bytecode."""
+    print_header("Precompiling Python Bytecode")
+    
+    compile_cmd = [sys.executable, '-m', 'compileall', '-q', '-j', '0',
+                   '-x', r'[/\\](build|\.venv|venv)[/\\]', '.']
+    
+    # Regular .pyc files are used by 'python app.py'; the -OO pass produces
+    # docstring-stripped *.opt-2.pyc files used by 'python -OO app.py'
+    if not run_command(compile_cmd):
+        print("❌ Bytecode compilation failed")
+        return False
+    if not run_command([sys.executable, '-OO'] + compile_cmd[1:]):
+        print("❌ Optimized bytecode compilation failed")
+        return False
+    
+    print("✅ Bytecode precompiled; ship the __pycache__ directories when packaging")
+    return True
+
 def test_installation():
     """Test if the installation was successful."""
     print_header("Testing Installation")
@@ -176,6 +338,54 @@ def test_installation():
     print("\n✅ Installation test completed!")
     return True
 
+ZIPAPP_PACKAGES = ['config', 'gui', 'llm_interface', 'utils']
+
+def make_zipapp():
+    """Bundle the application into a single compressed code_review.pyz."""
+    print_header("Creating Zipapp Bundle")
+    
+    import compileall
+    import shutil
+    import tempfile
+    import zipapp
+    
+    with tempfile.TemporaryDirectory() as staging:
+        staging_dir = Path(staging)
+        shutil.copy2('app.py', staging_dir / 'app.py')
+        for package in ZIPAPP_PACKAGES:
+            shutil.copytree(package, staging_dir / package,
+                            ignore=shutil.ignore_patterns('__pycache__', '*.pyc'))
+        
+        # Propagate main()'s exit code, which zipapp's generated
+        # __main__.py would discard. sys.path[0] is the archive itself, so
+        # also add its directory to find the C++ module kept beside it
+        (staging_dir / '__main__.py').write_text(
+            "import os\nimport sys\n"
+            "sys.path.insert(1, os.path.dirname(os.path.abspath(sys.argv[0])))\n"
+            "import app\nsys.exit(app.main())\n"
+        )
+        
+        # zipimport cannot write __pycache__ inside the archive, but it does
+        # load legacy .pyc files placed next to their sources
+        if not compileall.compile_dir(str(staging_dir), quiet=1, legacy=True):
+            print("❌ Failed to byte-compile the zipapp sources")
+            return False
+        
+        try:
+            zipapp.create_archive(
+                staging_dir,
+                target='code_review.pyz',
+                interpreter='/usr/bin/env python3',
+                compressed=True
+            )
+        except (OSError, zipapp.ZipAppError) as e:
+            print(f"❌ Failed to create zipapp: {e}")
+            return False
+    
+    print("✅ Created code_review.pyz (run with 'python code_review.pyz')")
+    print("   The C++ module is not bundled; keep it next to the archive or on PYTHONPATH")
+    return True
+
 def create_run_script():
     """Create a convenient run script."""
     print_header("Creating Run Scripts")
@@ -218,8 +428,11 @@ def main():
     steps = [
         ("Check Requirements", check_requirements),
         ("Install Python Dependencies", install_python_dependencies),
-        ("Build C++ Module", build_cpp_module),
+        ("Build C++ Module", lambda: build_cpp_module(pgo='--pgo' in sys.argv,
+                                                       avx2='--avx2' in sys.argv)),
+        ("Precompile Bytecode", precompile_bytecode),
         ("Test Installation", test_installation),
+        ("Create Zipapp", make_zipapp),
         ("Create Run Scripts", create_run_script),
     ]
     
@@ -6,10 +6,28 @@ and provides a centralized configuration interface.
 """
 
 import os
+from types import SimpleNamespace
 from typing import Optional, Dict, Any
 from pathlib import Path
-import json
 import logging
+import logging.handlers
+
+try:
+    import orjson
+    
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +42,8 @@ class ApplicationConfig:
         'buffer_size': 20,
         'flush_interval_ms': 100,
         'max_conversation_length': 50000,  # characters
-        'request_timeout': 30.0,  # seconds
+        'connect_timeout': 5.0,  # seconds
+        'request_timeout': 30.0,  # seconds, per read
         'max_retries': 3,
         'ui_theme': 'light',
         'window_width': 1200,
@@ -35,6 +54,8 @@ class ApplicationConfig:
     def __init__(self, config_file: Optional[str] = None):
         """Initialize configuration with optional config file."""
         self._config: Dict[str, Any] = {}
+        self._frozen = SimpleNamespace()
+        self._http_session = None
         self._config_file = config_file or self._get_default_config_path()
         self._load_configuration()
     
@@ -53,14 +74,14 @@ class ApplicationConfig:
         # Load from file if exists
         if os.path.exists(self._config_file):
             try:
-                with open(self._config_file, 'r', encoding='utf-8') as f:
-                    file_config = json.load(f)
-                    self._config.update(file_config)
-            except (json.JSONDecodeError, IOError) as e:
+                file_config = _json_loads(Path(self._config_file).read_bytes())
+                self._config.update(file_config)
+            except (ValueError, IOError) as e:
                 logger.warning(f"Failed to load config file {self._config_file}: {e}")
         
         # Override with environment variables
         self._load_from_environment()
+        self._freeze()
         
         # Setup logging
         self._setup_logging()
@@ -73,6 +94,7 @@ class ApplicationConfig:
             'BUFFER_SIZE': ('buffer_size', int),
             'FLUSH_INTERVAL_MS': ('flush_interval_ms', int),
             'MAX_CONVERSATION_LENGTH': ('max_conversation_length', int),
+            'CONNECT_TIMEOUT': ('connect_timeout', float),
             'REQUEST_TIMEOUT': ('request_timeout', float),
             'MAX_RETRIES': ('max_retries', int),
             'UI_THEME': 'ui_theme',
@@ -93,15 +115,31 @@ class ApplicationConfig:
                 else:
                     self._config[config_key] = env_value
     
+    def _freeze(self) -> None:
+        """Snapshot the settings into a namespace for fast attribute reads."""
+        self._frozen = SimpleNamespace(**self._config)
+    
     def _setup_logging(self) -> None:
         """Setup logging configuration."""
         log_level = getattr(logging, self._config['log_level'].upper(), logging.INFO)
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        
+        # The log file is only opened once buffered records are flushed to it,
+        # i.e. after 100 records or on the first warning
+        file_handler = logging.FileHandler('code_review_app.log', delay=True)
+        file_handler.setFormatter(formatter)
+        memory_handler = logging.handlers.MemoryHandler(
+            capacity=100,
+            flushLevel=logging.WARNING,
+            target=file_handler
+        )
+        
         logging.basicConfig(
             level=log_level,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             handlers=[
                 logging.StreamHandler(),
-                logging.FileHandler('code_review_app.log')
+                memory_handler
             ]
         )
     
@@ -112,51 +150,101 @@ class ApplicationConfig:
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value."""
         self._config[key] = value
+        self._freeze()
     
     def save(self) -> None:
         """Save current configuration to file."""
+        # Write to a temporary file and swap it in so a failed save
+        # never leaves a truncated config behind
+        tmp_file = f"{self._config_file}.tmp"
         try:
             os.makedirs(os.path.dirname(self._config_file), exist_ok=True)
-            with open(self._config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2)
-        except IOError as e:
+            Path(tmp_file).write_bytes(_json_dumps(self._config))
+            os.replace(tmp_file, self._config_file)
+        except (OSError, TypeError, ValueError) as e:
             logger.error(f"Failed to save config file: {e}")
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass  # Never created, or already gone
+    
+    @property
+    def http_session(self):
+        """Shared HTTP session with connection pooling, created on first use."""
+        if self._http_session is None:
+            import socket
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.connection import HTTPConnection
+            
+            class KeepAliveAdapter(HTTPAdapter):
+                """Adapter whose pooled sockets use TCP keep-alive."""
+                
+                def init_poolmanager(self, *args, **kwargs):
+                    kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+                        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                    ]
+                    super().init_poolmanager(*args, **kwargs)
+            
+            # Nothing is retried here: callers own their retry policy (the LLM
+            # client backs off between attempts), and adapter retries would
+            # stack on top of it and multiply timeouts on a hung service
+            adapter = KeepAliveAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=0
+            )
+            session = requests.Session()
+            session.headers['User-Agent'] = 'CodeReviewApp/1.0'
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._http_session = session
+        return self._http_session
     
     @property
     def ollama_api_url(self) -> str:
-        return self._config['ollama_api_url']
+        return self._frozen.ollama_api_url
     
     @property
     def model_name(self) -> str:
-        return self._config['model_name']
+        return self._frozen.model_name
     
     @property
     def buffer_size(self) -> int:
-        return self._config['buffer_size']
+        return self._frozen.buffer_size
     
     @property
     def flush_interval_ms(self) -> int:
-        return self._config['flush_interval_ms']
+        return self._frozen.flush_interval_ms
     
     @property
     def max_conversation_length(self) -> int:
-        return self._config['max_conversation_length']
+        return self._frozen.max_conversation_length
+    
+    @property
+    def connect_timeout(self) -> float:
+        return self._frozen.connect_timeout
     
     @property
     def request_timeout(self) -> float:
-        return self._config['request_timeout']
+        return self._frozen.request_timeout
+    
+    @property
+    def request_timeouts(self) -> tuple[float, float]:
+        """(connect, read) timeout pair for HTTP requests."""
+        return (self._frozen.connect_timeout, self._frozen.request_timeout)
     
     @property
     def max_retries(self) -> int:
-        return self._config['max_retries']
+        return self._frozen.max_retries
     
     @property
     def ui_theme(self) -> str:
-        return self._config['ui_theme']
+        return self._frozen.ui_theme
     
     @property
     def window_size(self) -> tuple[int, int]:
-        return (self._config['window_width'], self._config['window_height'])
+        return (self._frozen.window_width, self._frozen.window_height)
 
 
 # Global configuration instance
@@ -3,21 +3,42 @@
 #include <pybind11/stl.h>
 #include <pybind11/functional.h>
 #include <string>
+#include <string_view>
 #include <vector>
-#include <deque>
 #include <chrono>
 #include <mutex>
 #include <thread>
+#include <atomic>
 #include <functional>
+#include <fstream>
+#include <stdexcept>
+#include <cctype>
+#include <cstring>
+
+#ifdef CORE_HAS_SIMDUTF
+#include <simdutf.h>
+#endif
+
+#ifndef _WIN32
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
 
 class AdaptiveTextStreamer {
 private:
-    std::deque<std::string> token_buffer_;
+    // Tokens since the last flush, appended straight into the next batch
+    std::string pending_text_;
+    size_t pending_tokens_ = 0;
     std::string accumulated_text_;
-    std::mutex buffer_mutex_;
+    mutable std::mutex buffer_mutex_;
+    // Held while a batch is taken and delivered, so batches reach the
+    // callback in order; buffer_mutex_ is never held across the callback
+    std::mutex callback_mutex_;
     size_t buffer_size_;
     int flush_interval_ms_;
-    bool is_streaming_;
+    std::atomic<bool> is_streaming_;
     std::thread flush_thread_;
     std::function<void(const std::string&)> update_callback_;
 
@@ -33,20 +54,25 @@ public:
         update_callback_ = callback;
     }
 
-    void add_token(const std::string& token) {
-        std::lock_guard<std::mutex> lock(buffer_mutex_);
-        token_buffer_.push_back(token);
-        accumulated_text_ += token;
+    // A string_view argument reads the str's cached UTF-8 data in place
+    // instead of copying it into a temporary std::string first
+    void add_token(std::string_view token) {
+        bool full;
+        {
+            std::lock_guard<std::mutex> lock(buffer_mutex_);
+            pending_text_.append(token);
+            accumulated_text_.append(token);
+            full = ++pending_tokens_ >= buffer_size_;
+        }
         
-        if (token_buffer_.size() >= buffer_size_) {
-            flush_buffer_internal();
+        if (full) {
+            flush_buffer();
         }
     }
 
     void start_streaming() {
-        if (is_streaming_) return;
+        if (is_streaming_.exchange(true)) return;
         
-        is_streaming_ = true;
         flush_thread_ = std::thread([this]() {
             while (is_streaming_) {
                 std::this_thread::sleep_for(std::chrono::milliseconds(flush_interval_ms_));
@@ -56,9 +82,10 @@ public:
     }
 
     void stop_streaming() {
-        if (!is_streaming_) return;
+        // Called concurrently by cancel() and the worker; only one caller
+        // may join the flush thread
+        if (!is_streaming_.exchange(false)) return;
         
-        is_streaming_ = false;
         if (flush_thread_.joinable()) {
             flush_thread_.join();
         }
@@ -66,8 +93,19 @@ public:
     }
 
     void flush_buffer() {
-        std::lock_guard<std::mutex> lock(buffer_mutex_);
-        flush_buffer_internal();
+        std::lock_guard<std::mutex> callback_lock(callback_mutex_);
+        std::string batch_text;
+        {
+            std::lock_guard<std::mutex> lock(buffer_mutex_);
+            if (pending_tokens_ == 0 || !update_callback_) {
+                return;
+            }
+            batch_text.swap(pending_text_);
+            pending_tokens_ = 0;
+        }
+        
+        // The callback takes the GIL, so it must run without buffer_mutex_
+        update_callback_(batch_text);
     }
 
     std::string get_full_text() const {
@@ -77,13 +115,14 @@ public:
 
     void clear() {
         std::lock_guard<std::mutex> lock(buffer_mutex_);
-        token_buffer_.clear();
+        pending_text_.clear();
+        pending_tokens_ = 0;
         accumulated_text_.clear();
     }
 
     size_t get_buffer_size() const {
         std::lock_guard<std::mutex> lock(buffer_mutex_);
-        return token_buffer_.size();
+        return pending_tokens_;
     }
 
     void set_buffer_size(size_t size) {
@@ -94,24 +133,16 @@ public:
         flush_interval_ms_ = interval_ms;
     }
 
-private:
-    void flush_buffer_internal() {
-        if (!token_buffer_.empty() && update_callback_) {
-            std::string batch_text;
-            for (const auto& token : token_buffer_) {
-                batch_text += token;
-            }
-            token_buffer_.clear();
-            
-            // Call Python callback without holding the lock
-            update_callback_(batch_text);
-        }
-    }
 };
 
 class FileProcessor {
 public:
-    static std::string read_file_fast(const std::string& file_path) {
+    // Reads the whole file and decodes it as UTF-8, replacing invalid bytes
+    // and translating \r\n and lone \r to \n like the Python fallback.
+    // On POSIX the file is memory-mapped and decoded straight from the
+    // mapping, avoiding an intermediate std::string copy.
+    static pybind11::str read_file_fast(const std::string& file_path) {
+#ifdef _WIN32
         std::ifstream file(file_path, std::ios::binary);
         if (!file) {
             throw std::runtime_error("Failed to open file: " + file_path);
@@ -124,12 +155,96 @@ public:
         std::string content(size, '\0');
         file.read(&content[0], size);
         
-        return content;
+        PyObject* decoded = decode_text(content.data(), content.size());
+        if (!decoded) {
+            throw pybind11::error_already_set();
+        }
+        return pybind11::reinterpret_steal<pybind11::str>(decoded);
+#else
+        int fd = ::open(file_path.c_str(), O_RDONLY);
+        if (fd < 0) {
+            throw std::runtime_error("Failed to open file: " + file_path);
+        }
+        
+        struct stat st;
+        if (::fstat(fd, &st) != 0) {
+            ::close(fd);
+            throw std::runtime_error("Failed to stat file: " + file_path);
+        }
+        
+        size_t size = static_cast<size_t>(st.st_size);
+        if (size == 0) {
+            ::close(fd);
+            return pybind11::str("");
+        }
+        
+        void* data = ::mmap(nullptr, size, PROT_READ, MAP_PRIVATE, fd, 0);
+        ::close(fd);
+        if (data == MAP_FAILED) {
+            throw std::runtime_error("Failed to map file: " + file_path);
+        }
+        ::madvise(data, size, MADV_SEQUENTIAL);
+        ::madvise(data, size, MADV_WILLNEED);
+        
+        PyObject* decoded = decode_text(static_cast<const char*>(data), size);
+        {
+            pybind11::gil_scoped_release release;
+            ::munmap(data, size);
+        }
+        
+        if (!decoded) {
+            throw pybind11::error_already_set();
+        }
+        return pybind11::reinterpret_steal<pybind11::str>(decoded);
+#endif
     }
 
     static bool is_valid_python_file(const std::string& file_path) {
-        return file_path.length() > 3 && 
-               file_path.substr(file_path.length() - 3) == ".py";
+        size_t len = file_path.length();
+        return len > 3 &&
+               file_path[len - 3] == '.' &&
+               std::tolower(static_cast<unsigned char>(file_path[len - 2])) == 'p' &&
+               std::tolower(static_cast<unsigned char>(file_path[len - 1])) == 'y';
+    }
+
+private:
+    // Returns a new reference, or nullptr with a Python error set. A \r byte
+    // never occurs inside a multi-byte UTF-8 sequence, so newlines can be
+    // translated before decoding.
+    static PyObject* decode_text(const char* data, size_t size) {
+        if (!std::memchr(data, '\r', size)) {
+            return decode_utf8(data, size);
+        }
+        
+        std::string normalized;
+        normalized.reserve(size);
+        for (size_t i = 0; i < size; ++i) {
+            if (data[i] == '\r') {
+                normalized.push_back('\n');
+                if (i + 1 < size && data[i + 1] == '\n') {
+                    ++i;
+                }
+            } else {
+                normalized.push_back(data[i]);
+            }
+        }
+        return decode_utf8(normalized.data(), normalized.size());
+    }
+
+    // Returns a new reference, or nullptr with a Python error set.
+    static PyObject* decode_utf8(const char* data, size_t size) {
+#ifdef CORE_HAS_SIMDUTF
+        // Pure ASCII input (the common case for source files) is validated
+        // with SIMD and copied into a compact ASCII str without decoding.
+        if (simdutf::validate_ascii(data, size)) {
+            PyObject* result = PyUnicode_New(static_cast<Py_ssize_t>(size), 127);
+            if (result) {
+                std::memcpy(PyUnicode_DATA(result), data, size);
+            }
+            return result;
+        }
+#endif
+        return PyUnicode_DecodeUTF8(data, static_cast<Py_ssize_t>(size), "replace");
     }
 };
 
@@ -141,10 +256,15 @@ PYBIND11_MODULE(core_performance, m) {
              pybind11::arg("buffer_size") = 20, 
              pybind11::arg("flush_interval_ms") = 100)
         .def("set_update_callback", &AdaptiveTextStreamer::set_update_callback)
-        .def("add_token", &AdaptiveTextStreamer::add_token)
+        // These may wait on the flush thread while it delivers a batch to the
+        // Python callback, so they must not hold the GIL while doing so
+        .def("add_token", &AdaptiveTextStreamer::add_token,
+             pybind11::call_guard<pybind11::gil_scoped_release>())
         .def("start_streaming", &AdaptiveTextStreamer::start_streaming)
-        .def("stop_streaming", &AdaptiveTextStreamer::stop_streaming)
-        .def("flush_buffer", &AdaptiveTextStreamer::flush_buffer)
+        .def("stop_streaming", &AdaptiveTextStreamer::stop_streaming,
+             pybind11::call_guard<pybind11::gil_scoped_release>())
+        .def("flush_buffer", &AdaptiveTextStreamer::flush_buffer,
+             pybind11::call_guard<pybind11::gil_scoped_release>())
         .def("get_full_text", &AdaptiveTextStreamer::get_full_text)
         .def("clear", &AdaptiveTextStreamer::clear)
         .def("get_buffer_size", &AdaptiveTextStreamer::get_buffer_size)
@@ -6,19 +6,30 @@ handling, validation, and performance optimizations using C++ backend.
 """
 
 import os
+import stat
 import logging
-from typing import Optional
-from pathlib import Path
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-try:
-    # Try to import C++ performance module
-    import core_performance
-    HAS_CPP_BACKEND = True
-except ImportError:
-    logger.warning("C++ performance module not available. Using Python fallback.")
-    HAS_CPP_BACKEND = False
+# The C++ performance module is imported on first use; see _get_cpp()
+_MISSING = object()
+_cpp = _MISSING
+
+
+def _get_cpp():
+    """Return the C++ performance module, or None if it is not available."""
+    global _cpp
+    if _cpp is _MISSING:
+        try:
+            import core_performance as _cpp
+        except ImportError:
+            logger.warning("C++ performance module not available. Using Python fallback.")
+            _cpp = None
+    return _cpp
 
 
 class FileLoadError(Exception):
@@ -26,6 +37,34 @@ class FileLoadError(Exception):
     pass
 
 
+def _stat_or_raise(file_path: str) -> os.stat_result:
+    """
+    Stat a path once and ensure it refers to a regular file.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        os.stat_result: The stat result for the file
+        
+    Raises:
+        FileLoadError: If the path does not exist or is not a regular file
+    """
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileLoadError(f"File does not exist: {file_path}")
+    except PermissionError:
+        raise FileLoadError(f"Permission denied: {file_path}")
+    except OSError as e:
+        raise FileLoadError(f"OS error reading file: {e}")
+    
+    if not stat.S_ISREG(st.st_mode):
+        raise FileLoadError(f"Path is not a file: {file_path}")
+    
+    return st
+
+
 def load_file_content(file_path: str) -> str:
     """
     Load and return the content of a Python file with robust error handling.
@@ -44,32 +83,34 @@ def load_file_content(file_path: str) -> str:
     
     # Normalize and validate path
     normalized_path = os.path.normpath(file_path)
+    st = _stat_or_raise(normalized_path)
     
-    if not os.path.exists(normalized_path):
-        raise FileLoadError(f"File does not exist: {normalized_path}")
-    
-    if not os.path.isfile(normalized_path):
-        raise FileLoadError(f"Path is not a file: {normalized_path}")
-    
+    return _load_resolved(normalized_path, st)
+
+
+def _load_resolved(normalized_path: str, st: os.stat_result) -> str:
+    """Load an already validated file using the available backend."""
     # Use C++ backend if available
-    if HAS_CPP_BACKEND:
+    cpp = _get_cpp()
+    if cpp is not None:
         try:
-            if not core_performance.FileProcessor.is_valid_python_file(normalized_path):
+            if not cpp.FileProcessor.is_valid_python_file(normalized_path):
                 raise FileLoadError(f"File is not a Python file: {normalized_path}")
-            return core_performance.FileProcessor.read_file_fast(normalized_path)
+            return cpp.FileProcessor.read_file_fast(normalized_path)
         except RuntimeError as e:
             raise FileLoadError(f"C++ backend error: {e}")
     else:
         # Python fallback
-        return _load_file_python(normalized_path)
+        return _load_file_python(normalized_path, st)
 
 
-def _load_file_python(file_path: str) -> str:
+def _load_file_python(file_path: str, st: os.stat_result) -> str:
     """
     Python fallback for file loading.
     
     Args:
         file_path: Path to the file to load
+        st: Stat result for the file
         
     Returns:
         str: The content of the file
@@ -83,16 +124,30 @@ def _load_file_python(file_path: str) -> str:
             raise FileLoadError(f"File is not a Python file: {file_path}")
         
         # Check file size (prevent loading extremely large files)
-        file_size = os.path.getsize(file_path)
+        file_size = st.st_size
         if file_size > 10 * 1024 * 1024:  # 10MB limit
             raise FileLoadError(f"File too large: {file_size} bytes. Maximum is 10MB.")
         
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
+        # Read the whole file with a single syscall and decode it in one pass
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, file_size, os.POSIX_FADV_SEQUENTIAL)
+            data = os.read(fd, file_size)
+        finally:
+            os.close(fd)
+        
+        content = data.decode('utf-8', 'replace')
+        
+        # Match text-mode reads, which translate all newline styles to '\n'
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         
         logger.info(f"Successfully loaded file: {file_path} ({file_size} bytes)")
         return content
         
+    except FileLoadError:
+        raise
     except PermissionError:
         raise FileLoadError(f"Permission denied: {file_path}")
     except UnicodeDecodeError as e:
@@ -114,37 +169,43 @@ def validate_python_file(file_path: str) -> bool:
         bool: True if valid Python file, False otherwise
     """
     try:
-        if HAS_CPP_BACKEND:
-            return core_performance.FileProcessor.is_valid_python_file(file_path)
+        cpp = _get_cpp()
+        if cpp is not None:
+            return cpp.FileProcessor.is_valid_python_file(file_path)
         else:
-            return (os.path.exists(file_path) and 
-                   os.path.isfile(file_path) and 
-                   file_path.lower().endswith('.py'))
+            return (file_path.lower().endswith('.py') and
+                    stat.S_ISREG(os.stat(file_path).st_mode))
+    except OSError:
+        return False
     except Exception as e:
         logger.error(f"Error validating Python file {file_path}: {e}")
         return False
 
 
-def get_file_info(file_path: str) -> dict:
+def get_file_info(file_path: str, loader: Optional['FileLoader'] = None) -> dict:
     """
     Get detailed information about a file.
     
     Args:
         file_path: Path to the file
+        loader: Optional FileLoader whose cached stat result is reused if the
+            file has already been loaded through it
         
     Returns:
         dict: File information including size, modification time, etc.
     """
     try:
-        stat = os.stat(file_path)
+        st = loader._cached_stat(file_path) if loader is not None else None
+        if st is None:
+            st = _stat_or_raise(file_path)
         return {
             'path': os.path.abspath(file_path),
             'name': os.path.basename(file_path),
-            'size': stat.st_size,
-            'modified': stat.st_mtime,
-            'is_valid_python': validate_python_file(file_path)
+            'size': st.st_size,
+            'modified': st.st_mtime,
+            'is_valid_python': file_path.lower().endswith('.py')
         }
-    except OSError as e:
+    except FileLoadError as e:
         logger.error(f"Error getting file info for {file_path}: {e}")
         return {}
 
@@ -157,13 +218,17 @@ class FileLoader:
     def __init__(self, max_cache_size: int = 5):
         """Initialize file loader with optional caching."""
         self.max_cache_size = max_cache_size
-        self._cache = {}
-        self._cache_order = []
+        # Maps path -> (stat result, content), ordered by recency
+        self._cache: 'OrderedDict[str, Tuple[os.stat_result, str]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def load(self, file_path: str, use_cache: bool = True) -> str:
         """
         Load file content with optional caching.
         
+        Cached entries are invalidated when the file's modification time or
+        size changes.
+        
         Args:
             file_path: Path to the file to load
             use_cache: Whether to use caching
@@ -171,39 +236,82 @@ class FileLoader:
         Returns:
             str: File content
         """
-        normalized_path = os.path.normpath(file_path)
+        normalized_path = self._resolve(file_path)
+        st = _stat_or_raise(normalized_path)
+        
+        if not use_cache:
+            return _load_resolved(normalized_path, st)
         
         # Check cache first
-        if use_cache and normalized_path in self._cache:
-            logger.debug(f"Loading from cache: {normalized_path}")
-            # Move to end of cache order (LRU)
-            self._cache_order.remove(normalized_path)
-            self._cache_order.append(normalized_path)
-            return self._cache[normalized_path]
+        with self._cache_lock:
+            cached = self._cache.get(normalized_path)
+            if (cached is not None and
+                    cached[0].st_mtime_ns == st.st_mtime_ns and
+                    cached[0].st_size == st.st_size):
+                logger.debug(f"Loading from cache: {normalized_path}")
+                self._cache.move_to_end(normalized_path)
+                return cached[1]
         
         # Load from disk
-        content = load_file_content(normalized_path)
-        
-        # Update cache if enabled
-        if use_cache:
-            self._update_cache(normalized_path, content)
+        content = _load_resolved(normalized_path, st)
+        self._update_cache(normalized_path, st, content)
         
         return content
     
-    def _update_cache(self, file_path: str, content: str) -> None:
-        """Update the internal cache with new content."""
-        # Remove oldest item if cache is full
-        if len(self._cache) >= self.max_cache_size:
-            oldest = self._cache_order.pop(0)
-            del self._cache[oldest]
+    def _resolve(self, file_path: str) -> str:
+        """Resolve a path to the absolute key used by the cache."""
+        if not file_path or not isinstance(file_path, str):
+            raise FileLoadError("Invalid file path provided")
+        return os.path.abspath(file_path)
+    
+    def load_many(self, file_paths: Iterable[str], use_cache: bool = True,
+                  max_workers: int = 8) -> Dict[str, str]:
+        """
+        Load several files concurrently.
+        
+        Args:
+            file_paths: Paths of the files to load
+            use_cache: Whether to use caching
+            max_workers: Maximum number of reader threads
+            
+        Returns:
+            Dict[str, str]: File content keyed by the path as given
+            
+        Raises:
+            FileLoadError: If any of the files cannot be loaded
+        """
+        paths = list(file_paths)
+        if not paths:
+            return {}
         
-        self._cache[file_path] = content
-        self._cache_order.append(file_path)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+            contents = executor.map(lambda path: self.load(path, use_cache), paths)
+            return dict(zip(paths, contents))
+    
+    def _update_cache(self, file_path: str, st: os.stat_result, content: str) -> None:
+        """Update the internal cache with new content."""
+        with self._cache_lock:
+            self._cache[file_path] = (st, content)
+            self._cache.move_to_end(file_path)
+            
+            # Remove least recently used item if cache is full
+            if len(self._cache) > self.max_cache_size:
+                self._cache.popitem(last=False)
+    
+    def _cached_stat(self, file_path: str) -> Optional[os.stat_result]:
+        """Return the stat result recorded when the file was last loaded."""
+        try:
+            key = self._resolve(file_path)
+        except FileLoadError:
+            return None
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        return cached[0] if cached is not None else None
     
     def clear_cache(self) -> None:
         """Clear the file cache."""
-        self._cache.clear()
-        self._cache_order.clear()
+        with self._cache_lock:
+            self._cache.clear()
         logger.info("File cache cleared")
     
     def get_cache_info(self) -> dict:
@@ -211,15 +319,5 @@ class FileLoader:
         return {
             'cache_size': len(self._cache),
             'max_cache_size': self.max_cache_size,
-            'cached_files': list(self._cache_order)
+            'cached_files': list(self._cache)
         }
-    def get_file_info(self, file_path: str) -> dict:
-        try:
-            stat = os.stat(file_path)
-            return {
-                'name': os.path.basename(file_path),
-                'size': stat.st_size,
-                'is_valid_python': file_path.endswith('.py') and os.path.isfile(file_path)
-            }
-        except Exception as e:
-            return {}
\ No newline at end of file
@@ -6,42 +6,291 @@ better error handling, and integration with C++ performance modules.
 """
 
 import os
+import time
+import hashlib
 import logging
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QFileDialog, QTextBrowser, QTextEdit,
+    QMainWindow, QWidget, QFileDialog, QTextBrowser, QTextEdit, QPlainTextEdit,
     QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QMessageBox, 
-    QSizePolicy, QStatusBar, QProgressBar, QSplitter, QFrame
+    QSizePolicy, QStatusBar, QProgressBar, QSplitter, QFrame, QStyle
+)
+from PyQt6.QtCore import (
+    Qt, QThreadPool, QTimer, QThread, QObject, QRunnable, pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import (
+    QTextCursor, QFont, QTextDocument, QPalette, QColor, QIcon, QGuiApplication
 )
-from PyQt6.QtCore import Qt, QThreadPool, QTimer, QThread
-from PyQt6.QtGui import QTextCursor, QFont, QTextDocument, QPalette, QColor
 
-from gui.file_loader import FileLoader, FileLoadError
+from gui.file_loader import FileLoader, FileLoadError, get_file_info
 from llm_interface.review_task import TaskManager
 from config.app_config import config
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of rendered markdown documents kept per window
+MARKDOWN_CACHE_SIZE = 8
+
+# Maximum number of rendered markdown sections kept across all windows;
+# see split_markdown_sections()
+MARKDOWN_SECTION_CACHE_SIZE = 256
+
+# Upper bound on the accumulated response; older text is dropped past this
+MAX_RESPONSE_CHARS = 512_000
+RESPONSE_TRUNCATION_MARKER = "*[Earlier output truncated]*\n\n"
+
+# Quiet period after the last streamed chunk before markdown is rendered
+MARKDOWN_IDLE_DELAY_MS = 500
+
+# Theme stylesheets, built once and reused on every theme switch
+_DARK_QSS = """
+    QMainWindow { 
+        background-color: #2b2b2b; 
+        color: #ffffff; 
+    }
+    QTextBrowser, QTextEdit, QPlainTextEdit { 
+        background-color: #1e1e1e; 
+        color: #f0f0f0; 
+        border: 1px solid #555; 
+        border-radius: 8px; 
+        padding: 10px; 
+    }
+    QPushButton { 
+        background-color: #404040; 
+        color: #ffffff; 
+        border: 1px solid #666; 
+        border-radius: 6px; 
+        padding: 8px 16px; 
+    }
+    QPushButton:hover { 
+        background-color: #505050; 
+    }
+    QPushButton:pressed { 
+        background-color: #353535; 
+    }
+    QPushButton:disabled { 
+        background-color: #2a2a2a; 
+        color: #666; 
+    }
+    QLabel { 
+        color: #ffffff; 
+    }
+    QStatusBar { 
+        background-color: #333; 
+        color: #fff; 
+    }
+"""
+
+_LIGHT_QSS = """
+    QMainWindow { 
+        background-color: #ffffff; 
+        color: #000000; 
+    }
+    QTextBrowser, QTextEdit, QPlainTextEdit { 
+        background-color: #ffffff; 
+        color: #000000; 
+        border: 1px solid #ccc; 
+        border-radius: 8px; 
+        padding: 10px; 
+    }
+    QPushButton { 
+        background-color: #f0f0f0; 
+        color: #000000; 
+        border: 1px solid #ccc; 
+        border-radius: 6px; 
+        padding: 8px 16px; 
+    }
+    QPushButton:hover { 
+        background-color: #e0e0e0; 
+    }
+    QPushButton:pressed { 
+        background-color: #d0d0d0; 
+    }
+    QPushButton:disabled { 
+        background-color: #f5f5f5; 
+        color: #999; 
+    }
+"""
+
+_THEME_QSS = {"light": _LIGHT_QSS, "dark": _DARK_QSS}
+
+# Button icons by role, created once from the style's standard pixmaps;
+# emoji labels would go through color-emoji font fallback on every repaint
+_ICONS: Dict[str, QIcon] = {}
+
+_ICON_PIXMAPS = {
+    'open': QStyle.StandardPixmap.SP_DirOpenIcon,
+    'review': QStyle.StandardPixmap.SP_FileDialogContentsView,
+    'clear': QStyle.StandardPixmap.SP_DialogResetButton,
+    'theme_dark': QStyle.StandardPixmap.SP_TitleBarShadeButton,
+    'theme_light': QStyle.StandardPixmap.SP_TitleBarUnshadeButton,
+    'test': QStyle.StandardPixmap.SP_DriveNetIcon,
+    'ask': QStyle.StandardPixmap.SP_ArrowRight,
+}
+
+
+# Fixed label text, shared by every place that sets it
+_LABEL_SELECT_FILE = " Select File"
+_LABEL_REVIEW = " Review Code"
+_LABEL_CLEAR = " Clear"
+_LABEL_TEST = " Test LLM"
+_LABEL_ASK = " Ask"
+_LABEL_FILE = "File:"
+_STATUS_LLM_CONNECTED = "LLM: ✓ Connected"
+_STATUS_LLM_FAILED = "LLM: ✗ Failed"
+_STATUS_LLM_ERROR = "LLM: ✗ Error"
+
+
+def _load_icons(style: QStyle):
+    """Populate _ICONS from the given style if not done already."""
+    if not _ICONS:
+        for role, pixmap in _ICON_PIXMAPS.items():
+            _ICONS[role] = style.standardIcon(pixmap)
+
+
+def _theme_icon(theme: str) -> QIcon:
+    """Icon for the theme button, showing the theme it switches to."""
+    return _ICONS['theme_light' if theme == "dark" else 'theme_dark']
+
+
+# The markdown package is optional and imported on first use; see _get_markdown()
+_MISSING = object()
+_markdown = _MISSING
+
+
+def _get_markdown():
+    """Return the markdown module, or None if it is not installed."""
+    global _markdown
+    if _markdown is _MISSING:
+        try:
+            import markdown as _markdown
+        except ImportError:
+            logger.info("markdown package not available. Using Qt markdown renderer.")
+            _markdown = None
+    return _markdown
+
+
+def render_markdown_html(content: str) -> str:
+    """Convert markdown to HTML, using Qt's parser if markdown is not installed."""
+    md = _get_markdown()
+    if md is not None:
+        return md.markdown(content, extensions=['fenced_code', 'tables'])
+    
+    document = QTextDocument()
+    document.setMarkdown(content)
+    return document.toHtml()
+
+
+def split_markdown_sections(content: str) -> List[str]:
+    """
+    Split markdown into sections that render the same on their own.
+    
+    A section starts at an unindented heading or horizontal rule preceded by
+    a blank line outside fenced code, where no list, quote or paragraph can
+    continue across the boundary. Joining the sections gives back content.
+    
+    Args:
+        content: Markdown text
+        
+    Returns:
+        List[str]: The sections, in order
+    """
+    sections = []
+    start = 0
+    pos = 0
+    in_fence = False
+    prev_blank = True
+    for line in content.splitlines(keepends=True):
+        stripped = line.strip()
+        if stripped.startswith(('```', '~~~')):
+            in_fence = not in_fence
+        elif (not in_fence and prev_blank and pos > start
+              and (line.startswith('#') or stripped == '---')):
+            sections.append(content[start:pos])
+            start = pos
+        prev_blank = not stripped
+        pos += len(line)
+    sections.append(content[start:])
+    return sections
+
+
+# LRU of rendered section HTML keyed by _content_key(); only touched on the
+# GUI thread. The HTML carries no theme colors, so it is shared by both themes
+_SECTION_HTML_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
 
-class EnhancedTextDisplay(QTextBrowser):
+
+def _content_key(text: str) -> bytes:
+    """Cache key for markdown source text (a section or a whole response)."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+def _get_section_html(key: bytes) -> Optional[str]:
+    """Return cached HTML for a section, marking it recently used."""
+    html = _SECTION_HTML_CACHE.get(key)
+    if html is not None:
+        _SECTION_HTML_CACHE.move_to_end(key)
+    return html
+
+
+def _put_section_html(key: bytes, html: str):
+    """Cache HTML for a section, evicting the least recently used entry."""
+    _SECTION_HTML_CACHE[key] = html
+    _SECTION_HTML_CACHE.move_to_end(key)
+    if len(_SECTION_HTML_CACHE) > MARKDOWN_SECTION_CACHE_SIZE:
+        _SECTION_HTML_CACHE.popitem(last=False)
+
+
+def _warm_up_markdown():
+    """Import markdown and load its extensions so the first render is fast."""
+    md = _get_markdown()
+    if md is not None:
+        md.markdown("# warm\n\n```\nx\n```", extensions=['fenced_code', 'tables'])
+
+
+def _warm_up_text_layout():
+    """Lay out a throwaway HTML document to populate Qt's font and HTML caches."""
+    document = QTextDocument()
+    document.setDefaultFont(_code_font())
+    document.setHtml("<h1>warm</h1><p>warm</p><pre><code>warm</code></pre>")
+    document.size()
+
+
+def _code_font() -> QFont:
+    """Return the monospace font used for review output."""
+    font = QFont("Consolas", 11)  # Monospace font for code
+    font.setStyleHint(QFont.StyleHint.Monospace)
+    return font
+
+
+class EnhancedTextDisplay(QPlainTextEdit):
     """
     Enhanced text display widget with optimized rendering for streaming content.
+    
+    Streamed text is appended as plain text; the formatted markdown version
+    of a response is shown in a separate MarkdownDisplay.
     """
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Whether appends keep the view scrolled to the end; only changes
+        # when the scroll position does
+        self._follow_tail = True
         self._setup_display()
         self._setup_performance_optimizations()
+        
+        # Cursor kept at the end of the document; insertText advances it,
+        # so appends don't need a fresh copy of textCursor() each time
+        self._tail_cursor = QTextCursor(self.document())
+        self._tail_cursor.movePosition(QTextCursor.MoveOperation.End)
     
     def _setup_display(self):
         """Setup the text display widget."""
         # Set font and styling
-        font = QFont("Consolas", 11)  # Monospace font for code
-        font.setStyleHint(QFont.StyleHint.Monospace)
-        self.setFont(font)
+        self.setFont(_code_font())
         
         # Configure text behavior
-        self.setOpenExternalLinks(False)  # Handle links manually
+        self.setReadOnly(True)
         self.setTextInteractionFlags(
             Qt.TextInteractionFlag.TextSelectableByMouse | 
             Qt.TextInteractionFlag.TextSelectableByKeyboard
@@ -57,34 +306,99 @@ class EnhancedTextDisplay(QTextBrowser):
     
     def _setup_performance_optimizations(self):
         """Setup performance optimizations for text rendering."""
-        # Limit document size to prevent memory issues
-        self.document().setMaximumBlockCount(10000)
+        # Limit document size to prevent memory issues; QPlainTextEdit drops
+        # the oldest blocks cheaply once the limit is reached
+        self.setMaximumBlockCount(10000)
+        
+        # The view is read-only, so keeping undo history for inserts is waste
+        self.setUndoRedoEnabled(False)
+        self.document().setUndoRedoEnabled(False)
         
         # Optimize rendering
-        self.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+        self.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        
+        # The scroll bar object is fixed for the widget's lifetime
+        self._scrollbar = self.verticalScrollBar()
+        self._scrollbar.valueChanged.connect(self._on_scroll)
+    
+    def _on_scroll(self, value: int):
+        """Track whether the view is scrolled to the end."""
+        self._follow_tail = value == self._scrollbar.maximum()
+    
+    def clear(self):
+        """Clear the display and move the tail cursor back to the start."""
+        super().clear()
+        self._tail_cursor = QTextCursor(self.document())
+        self._tail_cursor.movePosition(QTextCursor.MoveOperation.End)
+    
+    def reset_with_header(self, header: str):
+        """Replace the whole document with header and append after it."""
+        self.document().setPlainText(header)
+        self._tail_cursor = QTextCursor(self.document())
+        self._tail_cursor.movePosition(QTextCursor.MoveOperation.End)
     
     def append_content_optimized(self, content: str):
         """
         Append content with optimized rendering to prevent UI freezing.
         """
-        # Check if we're at the bottom before adding content
-        scrollbar = self.verticalScrollBar()
-        at_bottom = scrollbar.value() == scrollbar.maximum()
-        
-        # Use QTextCursor for efficient appending
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertText(content)
+        self._tail_cursor.insertText(content)
         
-        # Auto-scroll if we were at the bottom
-        if at_bottom:
-            scrollbar.setValue(scrollbar.maximum())
+        # Auto-scroll if the user has not scrolled away from the end
+        if self._follow_tail:
+            self._scrollbar.setValue(self._scrollbar.maximum())
+
+
+class MarkdownDisplay(QTextBrowser):
+    """
+    Rich-text display for the rendered markdown of a response.
     
-    def set_content_with_markdown(self, content: str):
-        """Set content with markdown rendering (use sparingly)."""
-        self.setMarkdown(content)
+    Created on first use and swapped in for the streaming display once
+    streaming pauses or finishes.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFont(_code_font())
+        self.setOpenExternalLinks(False)  # Handle links manually
+        self.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+    
+    def set_rendered_html(self, html: str):
+        """Set content from markdown that has already been rendered to HTML."""
+        self.setHtml(html)
+
+
+class MarkdownRenderSignals(QObject):
+    """Signals for returning rendered markdown to the main thread."""
+    
+    # Emitted with (html per source or None on failure, caller context,
+    # render generation)
+    finished = pyqtSignal(object, object, int)
+
+
+class MarkdownRenderTask(QRunnable):
+    """Task that converts markdown sections to HTML off the GUI thread."""
+    
+    def __init__(self, sources: List[str], context: Any, generation: int):
+        super().__init__()
+        self.signals = MarkdownRenderSignals()
+        self._sources = sources
+        self._context = context
+        self._generation = generation
+    
+    def run(self):
+        """Render each markdown source and emit the resulting HTML."""
+        md = _get_markdown()
+        try:
+            htmls = [
+                md.markdown(source, extensions=['fenced_code', 'tables'])
+                for source in self._sources
+            ]
+        except Exception as e:
+            logger.error(f"Markdown rendering failed: {e}")
+            htmls = None
+        self.signals.finished.emit(htmls, self._context, self._generation)
 
 
 class MainWindow(QMainWindow):
@@ -96,25 +410,107 @@ class MainWindow(QMainWindow):
         # Initialize components
         self.file_loader = FileLoader()
         self.task_manager = TaskManager()
-        self.threadpool = QThreadPool()
+        # Share Qt's global pool with the startup probe instead of adding threads
+        self.threadpool = QThreadPool.globalInstance()
+        self.threadpool.setMaxThreadCount(max(2, QThread.idealThreadCount()))
+        self._llm_client = None
         
         # UI state
         self.current_theme = config.ui_theme
+        self._current_qss: Optional[str] = None
         self.selected_file_path = ""
-        self.full_response_text = ""
         
-        # Performance monitoring
-        self._last_update_time = 0
+        # Response text is accumulated as chunks and joined on demand
+        self._response_chunks: List[str] = []
+        self._response_len = 0
+        self._response_text_cache: Optional[str] = ""
+        
+        # Rendered markdown keyed by _content_key() of the source text
+        self._md_cache: Dict[bytes, str] = {}
+        # Incremented for every render request; results from older
+        # requests are stale and not displayed
+        self._render_generation = 0
+        # At most one render task runs at a time; the latest request made
+        # meanwhile waits here as (content, generation)
+        self._render_in_flight = False
+        self._queued_render: Optional[tuple] = None
+        
+        # Performance monitoring; _last_update_time is the monotonic time of
+        # the last streamed chunk, checked when _update_timer fires
+        self._last_update_time = 0.0
         self._update_timer = QTimer()
         self._update_timer.setSingleShot(True)
         self._update_timer.timeout.connect(self._delayed_markdown_update)
         
+        # Streamed chunks are buffered and written to the display in batches
+        self._pending_buf: List[str] = []
+        self._flush_timer = QTimer()
+        self._flush_timer.setInterval(33)
+        self._flush_timer.setSingleShot(False)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        
+        # Progress messages are coalesced; only the latest one is shown
+        self._latest_status = ""
+        self._status_timer = QTimer()
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._apply_latest_status)
+        
+        # Preference changes are written to disk at most once per second
+        self._config_save_timer = QTimer()
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.timeout.connect(config.save)
+        
         # Setup UI
+        _load_icons(self.style())
         self._init_ui()
         self._apply_theme()
         self._setup_window()
         
         logger.info("MainWindow initialized successfully")
+        
+        # Pay the markdown import and Qt's first HTML layout before the first
+        # response arrives rather than when it is displayed
+        self.threadpool.start(_warm_up_markdown)
+        QTimer.singleShot(0, _warm_up_text_layout)
+    
+    @property
+    def full_response_text(self) -> str:
+        """The accumulated response text, joined lazily from streamed chunks."""
+        if self._response_text_cache is None:
+            self._response_text_cache = ''.join(self._response_chunks)
+        return self._response_text_cache
+    
+    @full_response_text.setter
+    def full_response_text(self, text: str):
+        self._response_chunks = [text] if text else []
+        self._response_len = len(text)
+        self._response_text_cache = text
+    
+    @property
+    def has_response(self) -> bool:
+        """Whether any response text has been accumulated, without joining it."""
+        return self._response_len > 0
+    
+    def _truncate_response(self):
+        """Drop the oldest chunks, keeping about 90% of MAX_RESPONSE_CHARS."""
+        budget = int(MAX_RESPONSE_CHARS * 0.9)
+        kept: List[str] = []
+        total = 0
+        for chunk in reversed(self._response_chunks):
+            if total + len(chunk) > budget:
+                if not kept:
+                    # A single oversized chunk; keep its tail
+                    kept.append(chunk[-budget:])
+                    total = budget
+                break
+            kept.append(chunk)
+            total += len(chunk)
+        kept.reverse()
+        
+        self._response_chunks = [RESPONSE_TRUNCATION_MARKER] + kept
+        self._response_len = len(RESPONSE_TRUNCATION_MARKER) + total
+        self._response_text_cache = None
+        logger.debug("Response truncated to %d characters", self._response_len)
     
     def _init_ui(self):
         """Initialize the user interface."""
@@ -127,11 +523,15 @@ class MainWindow(QMainWindow):
         main_layout.setSpacing(10)
         
         # Create UI sections
-        self._create_toolbar()
-        self._create_file_info_section()
-        self._create_main_content()
-        self._create_input_section()
-        self._create_status_bar()
+        for create_section in (self._create_toolbar,
+                               self._create_file_info_section,
+                               self._create_main_content,
+                               self._create_input_section,
+                               self._create_status_bar):
+            t0 = time.perf_counter()
+            create_section()
+            logger.debug("%s took %.1f ms", create_section.__name__,
+                         (time.perf_counter() - t0) * 1000)
         
         # Add sections to main layout
         main_layout.addLayout(self.toolbar_layout)
@@ -145,28 +545,29 @@ class MainWindow(QMainWindow):
         self.toolbar_layout.setSpacing(8)
         
         # File selection button
-        self.select_file_btn = QPushButton("📂 Select File")
+        self.select_file_btn = QPushButton(_ICONS['open'], _LABEL_SELECT_FILE)
         self.select_file_btn.setToolTip("Select a Python file for review")
         self.select_file_btn.clicked.connect(self._select_file)
         
         # Review button
-        self.review_btn = QPushButton("🔍 Review Code")
+        self.review_btn = QPushButton(_ICONS['review'], _LABEL_REVIEW)
         self.review_btn.setToolTip("Start code review")
         self.review_btn.clicked.connect(self._review_code)
         self.review_btn.setEnabled(False)
         
         # Clear button
-        self.clear_btn = QPushButton("🗑️ Clear")
+        self.clear_btn = QPushButton(_ICONS['clear'], _LABEL_CLEAR)
         self.clear_btn.setToolTip("Clear the review output")
         self.clear_btn.clicked.connect(self._clear_output)
         
         # Theme toggle button
-        self.theme_btn = QPushButton("🌙" if self.current_theme == "light" else "☀️")
+        self.theme_btn = QPushButton()
+        self.theme_btn.setIcon(_theme_icon(self.current_theme))
         self.theme_btn.setToolTip("Toggle dark/light theme")
         self.theme_btn.clicked.connect(self._toggle_theme)
         
         # Connection test button
-        self.test_connection_btn = QPushButton("🔗 Test LLM")
+        self.test_connection_btn = QPushButton(_ICONS['test'], _LABEL_TEST)
         self.test_connection_btn.setToolTip("Test connection to LLM service")
         self.test_connection_btn.clicked.connect(self._test_llm_connection)
         
@@ -191,7 +592,7 @@ class MainWindow(QMainWindow):
         self.file_size_label = QLabel("")
         self.file_size_label.setStyleSheet("color: gray; font-size: 11px;")
         
-        self.file_info_layout.addWidget(QLabel("📄 File:"))
+        self.file_info_layout.addWidget(QLabel(_LABEL_FILE))
         self.file_info_layout.addWidget(self.file_label)
         self.file_info_layout.addWidget(self.file_size_label)
         self.file_info_layout.addStretch()
@@ -200,15 +601,24 @@ class MainWindow(QMainWindow):
         """Create the main content area with splitter."""
         self.content_splitter = QSplitter(Qt.Orientation.Horizontal)
         
-        # Review output display
+        # Review output display; the markdown view is created on first use
         self.review_output = EnhancedTextDisplay()
         self.review_output.setMinimumHeight(500)
+        self.markdown_output: Optional[MarkdownDisplay] = None
         
+        self.content_splitter.addWidget(self.review_output)
+        
+        # The side panel is not visible at startup, so build it once the
+        # event loop is running
+        self.side_panel = None
+        QTimer.singleShot(0, self._build_secondary_widgets)
+    
+    def _build_secondary_widgets(self):
+        """Create widgets that are not visible when the window first appears."""
         # Optional side panel for additional info (collapsed by default)
         self.side_panel = QFrame()
         self.side_panel.setMaximumWidth(0)  # Hidden initially
         
-        self.content_splitter.addWidget(self.review_output)
         self.content_splitter.addWidget(self.side_panel)
         self.content_splitter.setSizes([1000, 0])  # Full width to main panel
     
@@ -224,7 +634,7 @@ class MainWindow(QMainWindow):
         self.followup_input.setEnabled(False)
         
         # Ask button
-        self.ask_btn = QPushButton("➤ Ask")
+        self.ask_btn = QPushButton(_ICONS['ask'], _LABEL_ASK)
         self.ask_btn.setFixedSize(60, 50)
         self.ask_btn.setEnabled(False)
         self.ask_btn.clicked.connect(self._ask_followup)
@@ -258,12 +668,15 @@ class MainWindow(QMainWindow):
         width, height = config.window_size
         self.resize(width, height)
         
-        # Center window on screen
-        self._center_window()
+        # Restore the last position; only query the screen on first launch
+        x, y = config.get('window_x'), config.get('window_y')
+        if x is not None and y is not None:
+            self.move(x, y)
+        else:
+            self._center_window()
     
     def _center_window(self):
         """Center the window on the screen."""
-        from PyQt6.QtGui import QGuiApplication
         screen = QGuiApplication.primaryScreen().geometry()
         window = self.geometry()
         self.move(
@@ -273,85 +686,11 @@ class MainWindow(QMainWindow):
     
     def _apply_theme(self):
         """Apply the current theme to the application."""
-        if self.current_theme == "dark":
-            self._apply_dark_theme()
-        else:
-            self._apply_light_theme()
-    
-    def _apply_dark_theme(self):
-        """Apply dark theme styling."""
-        dark_stylesheet = """
-            QMainWindow { 
-                background-color: #2b2b2b; 
-                color: #ffffff; 
-            }
-            QTextBrowser, QTextEdit { 
-                background-color: #1e1e1e; 
-                color: #f0f0f0; 
-                border: 1px solid #555; 
-                border-radius: 8px; 
-                padding: 10px; 
-            }
-            QPushButton { 
-                background-color: #404040; 
-                color: #ffffff; 
-                border: 1px solid #666; 
-                border-radius: 6px; 
-                padding: 8px 16px; 
-            }
-            QPushButton:hover { 
-                background-color: #505050; 
-            }
-            QPushButton:pressed { 
-                background-color: #353535; 
-            }
-            QPushButton:disabled { 
-                background-color: #2a2a2a; 
-                color: #666; 
-            }
-            QLabel { 
-                color: #ffffff; 
-            }
-            QStatusBar { 
-                background-color: #333; 
-                color: #fff; 
-            }
-        """
-        self.setStyleSheet(dark_stylesheet)
-    
-    def _apply_light_theme(self):
-        """Apply light theme styling."""
-        light_stylesheet = """
-            QMainWindow { 
-                background-color: #ffffff; 
-                color: #000000; 
-            }
-            QTextBrowser, QTextEdit { 
-                background-color: #ffffff; 
-                color: #000000; 
-                border: 1px solid #ccc; 
-                border-radius: 8px; 
-                padding: 10px; 
-            }
-            QPushButton { 
-                background-color: #f0f0f0; 
-                color: #000000; 
-                border: 1px solid #ccc; 
-                border-radius: 6px; 
-                padding: 8px 16px; 
-            }
-            QPushButton:hover { 
-                background-color: #e0e0e0; 
-            }
-            QPushButton:pressed { 
-                background-color: #d0d0d0; 
-            }
-            QPushButton:disabled { 
-                background-color: #f5f5f5; 
-                color: #999; 
-            }
-        """
-        self.setStyleSheet(light_stylesheet)
+        qss = _THEME_QSS.get(self.current_theme, _LIGHT_QSS)
+        # Re-applying the same stylesheet would still make Qt re-parse it
+        if qss is not self._current_qss:
+            self.setStyleSheet(qss)
+            self._current_qss = qss
     
     # Event handlers
     def _select_file(self):
@@ -372,7 +711,7 @@ class MainWindow(QMainWindow):
     def _load_selected_file(self, file_path: str):
         """Load and display information about the selected file."""
         try:
-            file_info = self.file_loader.get_file_info(file_path)
+            file_info = get_file_info(file_path, self.file_loader)
             
             if not file_info.get('is_valid_python', False):
                 QMessageBox.warning(self, "Invalid File", "Please select a valid Python file.")
@@ -402,10 +741,7 @@ class MainWindow(QMainWindow):
             # Load file content
             code = self.file_loader.load(self.selected_file_path)
             
-            # Clear previous output
-            self._clear_output()
-            
-            # Start review task
+            # Start review task; this also replaces the previous output
             self._start_review_task(code)
             
         except FileLoadError as e:
@@ -420,13 +756,19 @@ class MainWindow(QMainWindow):
         # Set UI state for processing
         self._set_processing_state(True, "Analyzing code...")
         
-        # Reset response text
+        # Reset the display and response text to just the header
         filename = os.path.basename(self.selected_file_path)
-        self.full_response_text = f"# Code Review: {filename}\n\n"
+        header = f"# Code Review: {filename}\n\n"
+        self._pending_buf.clear()
+        self._render_generation += 1
+        self._show_stream_view()
+        self.review_output.reset_with_header(header)
+        self.full_response_text = header
         
         # Start task
         task = self.task_manager.start_review(code, self)
         self.threadpool.start(task)
+        self._flush_timer.start()
         
         logger.info(f"Started review task for {filename}")
     
@@ -444,6 +786,7 @@ class MainWindow(QMainWindow):
             # Start follow-up task
             task = self.task_manager.start_followup(self.full_response_text, question, self)
             self.threadpool.start(task)
+            self._flush_timer.start()
             
             # Clear input
             self.followup_input.clear()
@@ -456,7 +799,12 @@ class MainWindow(QMainWindow):
     
     def _clear_output(self):
         """Clear the review output."""
+        self._pending_buf.clear()
+        self._render_generation += 1
+        self._show_stream_view()
         self.review_output.clear()
+        if self.markdown_output is not None:
+            self.markdown_output.clear()
         self.full_response_text = ""
         logger.debug("Review output cleared")
     
@@ -466,31 +814,34 @@ class MainWindow(QMainWindow):
         self._apply_theme()
         
         # Update theme button
-        self.theme_btn.setText("☀️" if self.current_theme == "dark" else "🌙")
+        self.theme_btn.setIcon(_theme_icon(self.current_theme))
         
-        # Save theme preference
+        # Save theme preference; rapid toggles end up as a single write
         config.set('ui_theme', self.current_theme)
-        config.save()
+        self._config_save_timer.start(1000)
         
         logger.info(f"Theme changed to: {self.current_theme}")
     
     def _test_llm_connection(self):
         """Test connection to the LLM service."""
-        from llm_interface.qwen_runner import llm_client
+        if self._llm_client is None:
+            # Imported on first use to keep it off the startup path
+            from llm_interface.qwen_runner import llm_client
+            self._llm_client = llm_client
         
         self.status_label.setText("Testing LLM connection...")
         
         try:
-            if llm_client.test_connection():
-                self.connection_status.setText("LLM: ✓ Connected")
+            if self._llm_client.test_connection():
+                self.connection_status.setText(_STATUS_LLM_CONNECTED)
                 self.connection_status.setStyleSheet("color: green;")
                 QMessageBox.information(self, "Connection Test", "Successfully connected to LLM service!")
             else:
-                self.connection_status.setText("LLM: ✗ Failed")
+                self.connection_status.setText(_STATUS_LLM_FAILED)
                 self.connection_status.setStyleSheet("color: red;")
                 QMessageBox.warning(self, "Connection Test", "Failed to connect to LLM service.")
         except Exception as e:
-            self.connection_status.setText("LLM: ✗ Error")
+            self.connection_status.setText(_STATUS_LLM_ERROR)
             self.connection_status.setStyleSheet("color: red;")
             QMessageBox.critical(self, "Connection Test", f"Connection test error: {e}")
         
@@ -501,11 +852,13 @@ class MainWindow(QMainWindow):
         # Enable/disable buttons
         self.select_file_btn.setEnabled(not is_processing)
         self.review_btn.setEnabled(not is_processing and bool(self.selected_file_path))
-        self.ask_btn.setEnabled(not is_processing and bool(self.full_response_text))
-        self.followup_input.setEnabled(not is_processing and bool(self.full_response_text))
+        self.ask_btn.setEnabled(not is_processing and self.has_response)
+        self.followup_input.setEnabled(not is_processing and self.has_response)
         
         # Update status
         if status_text:
+            # Don't let a queued progress message overwrite the new state
+            self._status_timer.stop()
             self.status_label.setText(status_text)
         
         # Show/hide progress bar
@@ -513,47 +866,192 @@ class MainWindow(QMainWindow):
         if is_processing:
             self.progress_bar.setRange(0, 0)  # Indeterminate progress
     
+    def _show_stream_view(self):
+        """Show the plain-text streaming display in the content area."""
+        if self.content_splitter.widget(0) is not self.review_output:
+            self.content_splitter.replaceWidget(0, self.review_output)
+    
+    def _show_markdown_view(self, content: str):
+        """Render content as markdown and show it in place of the stream."""
+        self._render_generation += 1
+        key = _content_key(content)
+        
+        html = self._md_cache.get(key)
+        if html is not None:
+            self._display_html(html)
+            return
+        
+        if _get_markdown() is None:
+            # Qt's renderer needs a QTextDocument, so it stays on this thread
+            html = render_markdown_html(content)
+            self._cache_html(key, html)
+            self._display_html(html)
+            return
+        
+        # Only sections that were not rendered before are parsed; while
+        # streaming or after a follow-up that is usually just the last one
+        sections = split_markdown_sections(content)
+        section_keys = [_content_key(section) for section in sections]
+        known = {}
+        missing = {}
+        for section_key, section in zip(section_keys, sections):
+            cached = _get_section_html(section_key)
+            if cached is not None:
+                known[section_key] = cached
+            else:
+                missing[section_key] = section
+        
+        context = (key, section_keys, known, list(missing))
+        if not missing:
+            self._apply_rendered_sections([], context, self._render_generation)
+            return
+        
+        if self._render_in_flight:
+            # Started when the running task is done, so sections it renders
+            # are reused rather than parsed twice
+            self._queued_render = (content, self._render_generation)
+            return
+        
+        # Parse on the thread pool; only layout happens on the GUI thread
+        self._render_in_flight = True
+        task = MarkdownRenderTask(list(missing.values()), context, self._render_generation)
+        task.signals.finished.connect(self._on_render_task_finished)
+        self.threadpool.start(task)
+    
+    @pyqtSlot(object, object, int)
+    def _on_render_task_finished(self, htmls: Optional[List[str]], context: tuple, generation: int):
+        """Slot receiving the result of a MarkdownRenderTask."""
+        self._render_in_flight = False
+        if htmls is not None:
+            self._apply_rendered_sections(htmls, context, generation)
+        
+        queued, self._queued_render = self._queued_render, None
+        if queued is not None and queued[1] == self._render_generation:
+            self._show_markdown_view(queued[0])
+    
+    def _apply_rendered_sections(self, htmls: List[str], context: tuple, generation: int):
+        """Cache newly rendered sections and show the assembled document."""
+        key, section_keys, known, missing_keys = context
+        for section_key, section_html in zip(missing_keys, htmls):
+            known[section_key] = section_html
+            _put_section_html(section_key, section_html)
+        
+        html = '\n'.join(known[section_key] for section_key in section_keys)
+        self._cache_html(key, html)
+        if generation == self._render_generation:
+            self._display_html(html)
+    
+    def _display_html(self, html: str):
+        """Show rendered HTML in the markdown view."""
+        if self.markdown_output is None:
+            self.markdown_output = MarkdownDisplay()
+            self.markdown_output.setMinimumHeight(500)
+        
+        self.markdown_output.set_rendered_html(html)
+        
+        if self.content_splitter.widget(0) is not self.markdown_output:
+            self.content_splitter.replaceWidget(0, self.markdown_output)
+    
+    def _cache_html(self, key: bytes, html: str):
+        """Store rendered HTML, evicting the oldest entry when full."""
+        if key not in self._md_cache and len(self._md_cache) >= MARKDOWN_CACHE_SIZE:
+            # Dicts preserve insertion order, so the first key is the oldest
+            del self._md_cache[next(iter(self._md_cache))]
+        self._md_cache[key] = html
+    
     def _delayed_markdown_update(self):
         """Update markdown display with delay to prevent UI freezing."""
+        # Content may have arrived since the timer was armed; wait out the
+        # rest of the quiet period instead of rendering mid-stream
+        idle_ms = (time.monotonic() - self._last_update_time) * 1000
+        if idle_ms < MARKDOWN_IDLE_DELAY_MS:
+            self._update_timer.start(int(MARKDOWN_IDLE_DELAY_MS - idle_ms) + 1)
+            return
+        
         if self.full_response_text:
-            self.review_output.set_content_with_markdown(self.full_response_text)
+            self._show_markdown_view(self.full_response_text)
     
-    # Task callback methods
-    def append_content(self, content: str):
-        """Callback for appending content from tasks."""
-        self.full_response_text += content
+    def _flush_pending(self):
+        """Write buffered streamed content to the display in one insert."""
+        # Pick up batches queued by the C++ streamer's flush thread
+        task = self.task_manager.current_task
+        if task is not None:
+            queue = task.content_queue
+            while queue:
+                self.append_content(queue.popleft())
+        
+        if not self._pending_buf:
+            return
+        
+        content = ''.join(self._pending_buf)
+        self._pending_buf.clear()
+        
+        # Any render still in flight no longer covers the whole response
+        self._render_generation += 1
+        self._show_stream_view()
         
         # Use optimized appending instead of full markdown update
         self.review_output.append_content_optimized(content)
+    
+    def _stop_flushing(self):
+        """Flush any remaining streamed content and stop the flush timer."""
+        self._flush_timer.stop()
+        self._flush_pending()
+    
+    # Task callback methods
+    @pyqtSlot(str)
+    def append_content(self, content: str):
+        """Callback for appending content from tasks."""
+        self._pending_buf.append(content)
+        self._response_chunks.append(content)
+        self._response_len += len(content)
+        self._response_text_cache = None
+        if self._response_len > MAX_RESPONSE_CHARS:
+            self._truncate_response()
         
-        # Schedule delayed markdown update for final formatting
-        self._update_timer.start(500)  # Update markdown after 500ms delay
+        # Schedule delayed markdown update for final formatting; the timer is
+        # armed once and re-checks the idle time, not restarted per chunk
+        self._last_update_time = time.monotonic()
+        if not self._update_timer.isActive():
+            self._update_timer.start(MARKDOWN_IDLE_DELAY_MS)
     
+    @pyqtSlot()
     def task_finished(self):
         """Callback for when a task finishes."""
+        self._stop_flushing()
         self._set_processing_state(False, "Ready")
         
         # Enable follow-up input if we have content
-        if self.full_response_text:
+        if self.has_response:
             self.followup_input.setEnabled(True)
             self.ask_btn.setEnabled(True)
         
         # Final markdown update
         self._update_timer.stop()
-        self.review_output.set_content_with_markdown(self.full_response_text)
+        if self.full_response_text:
+            self._show_markdown_view(self.full_response_text)
         
         logger.info("Task completed successfully")
     
+    @pyqtSlot(str)
     def display_error(self, error_message: str):
         """Callback for displaying errors from tasks."""
+        self._stop_flushing()
         self._set_processing_state(False, "Error occurred")
         
         QMessageBox.critical(self, "Task Error", error_message)
         logger.error(f"Task error: {error_message}")
     
+    @pyqtSlot(str)
     def update_progress(self, progress_text: str):
         """Callback for updating progress information."""
-        self.status_label.setText(progress_text)
+        self._latest_status = progress_text
+        if not self._status_timer.isActive():
+            self._status_timer.start(100)
+    
+    def _apply_latest_status(self):
+        """Show the most recent progress message in the status bar."""
+        self.status_label.setText(self._latest_status)
     
     def closeEvent(self, event):
         """Handle application close event."""
@@ -561,9 +1059,12 @@ class MainWindow(QMainWindow):
         if self.task_manager.current_task:
             self.task_manager.current_task.cancel()
         
-        # Save window geometry
+        # Save window geometry along with any pending preference changes
+        self._config_save_timer.stop()
         config.set('window_width', self.width())
         config.set('window_height', self.height())
+        config.set('window_x', self.x())
+        config.set('window_y', self.y())
         config.save()
         
         logger.info("Application closing")
@@ -14,8 +14,57 @@ from contextlib import contextmanager
 
 from config.app_config import config
 
+try:
+    import orjson
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # only need to catch the latter
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
 logger = logging.getLogger(__name__)
 
+# Size of each read from the response body while streaming
+STREAM_READ_SIZE = 65536
+
+# How long a successful connection test is trusted before checking again
+CONNECTION_OK_TTL_S = 5.0
+
+# Request bodies are serialized up front and sent as raw bytes
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# System messages are shared by every request and must not be mutated
+_REVIEW_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are an expert software engineer and code reviewer. "
+        "Provide a comprehensive, constructive review of the provided Python code. "
+        "Focus on:\n"
+        "1. Code correctness and potential bugs\n"
+        "2. Code style and readability\n"
+        "3. Performance considerations\n"
+        "4. Security concerns\n"
+        "5. Best practices and improvements\n"
+        "6. Documentation and comments\n\n"
+        "Format your response in clear, structured markdown."
+    )
+}
+
+_FOLLOWUP_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are continuing a code review conversation. "
+        "Use the previous review as context and answer the user's follow-up question "
+        "in a helpful and detailed manner."
+    )
+}
+
+_REVIEW_USER_TEMPLATE = "Please review the following Python code:\n\n```python\n{code}\n```"
+
 
 class LLMError(Exception):
     """Base exception for LLM-related errors."""
@@ -45,23 +94,19 @@ class EnhancedLLMClient:
     def __init__(self):
         """Initialize the LLM client with configuration."""
         self.api_url = config.ollama_api_url
+        self._tags_url = self.api_url.replace('/api/chat', '/api/tags')
+        self._conn_ok_until = 0.0
         self.model_name = config.model_name
-        self.timeout = config.request_timeout
+        self.timeout = config.request_timeouts  # (connect, read)
         self.max_retries = config.max_retries
         
-        # Create a reusable session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'CodeReviewApp/1.0'
-        })
+        # Share the application's pooled session; the startup service probe
+        # leaves a warm keep-alive connection in it for the first request.
+        # The session never retries, so _stream_response owns the retry
+        # policy and test_connection blocks for at most its own timeout
+        self.session = config.http_session
         
-        logger.info(f"Initialized LLM client for model: {self.model_name}")
-    
-    def __del__(self):
-        """Cleanup session on destruction."""
-        if hasattr(self, 'session'):
-            self.session.close()
+        logger.info("Initialized LLM client for model: %s", self.model_name)
     
     @contextmanager
     def _handle_request_errors(self):
@@ -79,43 +124,22 @@ class EnhancedLLMClient:
     
     def _create_review_payload(self, code: str) -> Dict[str, Any]:
         """Create the payload for code review requests."""
-        system_message = (
-            "You are an expert software engineer and code reviewer. "
-            "Provide a comprehensive, constructive review of the provided Python code. "
-            "Focus on:\n"
-            "1. Code correctness and potential bugs\n"
-            "2. Code style and readability\n"
-            "3. Performance considerations\n"
-            "4. Security concerns\n"
-            "5. Best practices and improvements\n"
-            "6. Documentation and comments\n\n"
-            "Format your response in clear, structured markdown."
-        )
-        
-        user_message = f"Please review the following Python code:\n\n```python\n{code}\n```"
-        
         return {
             "model": self.model_name,
             "stream": True,
             "messages": [
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": user_message}
+                _REVIEW_SYSTEM_MESSAGE,
+                {"role": "user", "content": _REVIEW_USER_TEMPLATE.format(code=code)}
             ]
         }
     
     def _create_followup_payload(self, original_review: str, question: str) -> Dict[str, Any]:
         """Create the payload for follow-up questions."""
-        system_message = (
-            "You are continuing a code review conversation. "
-            "Use the previous review as context and answer the user's follow-up question "
-            "in a helpful and detailed manner."
-        )
-        
         return {
             "model": self.model_name,
             "stream": True,
             "messages": [
-                {"role": "system", "content": system_message},
+                _FOLLOWUP_SYSTEM_MESSAGE,
                 {"role": "user", "content": f"Previous review:\n\n{original_review}"},
                 {"role": "user", "content": f"Follow-up question: {question}"}
             ]
@@ -131,12 +155,17 @@ class EnhancedLLMClient:
         Yields:
             str: Individual tokens from the response
         """
+        # Serialize once; the payload carries the whole code sample or review
+        # and is reused by every retry attempt
+        body = _json_dumps(payload)
+        
         for attempt in range(self.max_retries + 1):
             try:
                 with self._handle_request_errors():
                     response = self.session.post(
                         self.api_url,
-                        json=payload,
+                        data=body,
+                        headers=_JSON_HEADERS,
                         stream=True,
                         timeout=self.timeout
                     )
@@ -148,15 +177,82 @@ class EnhancedLLMClient:
             except (LLMConnectionError, LLMTimeoutError) as e:
                 if attempt < self.max_retries:
                     wait_time = 2 ** attempt  # Exponential backoff
-                    logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {wait_time}s...")
+                    logger.warning("Attempt %d failed: %s. Retrying in %ds...", attempt + 1, e, wait_time)
                     time.sleep(wait_time)
                 else:
-                    logger.error(f"All retry attempts failed: {e}")
+                    logger.error("All retry attempts failed: %s", e)
                     raise
             except (LLMResponseError, LLMError) as e:
-                logger.error(f"Non-retryable error: {e}")
+                logger.error("Non-retryable error: %s", e)
                 raise
     
+    def _iter_json_lines(self, response: requests.Response) -> Iterator[Dict[str, Any]]:
+        """
+        Parse a newline-delimited JSON response body as it arrives.
+        
+        Lines are split out of a byte buffer and parsed without decoding them
+        to str first; anything that is not a JSON object is skipped.
+        
+        Args:
+            response: Streaming HTTP response
+            
+        Yields:
+            dict: One parsed object per line
+        """
+        buf = bytearray()
+        for chunk in self._iter_body_chunks(response):
+            buf += chunk
+            start = 0
+            while True:
+                end = buf.find(b"\n", start)
+                if end == -1:
+                    break
+                data = self._parse_json_line(buf[start:end])
+                start = end + 1
+                if data is not None:
+                    yield data
+            del buf[:start]
+        
+        # The last line may not be newline-terminated
+        data = self._parse_json_line(buf)
+        if data is not None:
+            yield data
+    
+    @staticmethod
+    def _iter_body_chunks(response: requests.Response) -> Iterator[bytes]:
+        """Yield the response body in pieces as soon as they are received."""
+        read1 = getattr(response.raw, 'read1', None)
+        if read1 is None:
+            # urllib3 before 2.3 has no read1; chunk_size=None yields each
+            # received HTTP chunk
+            yield from response.iter_content(chunk_size=None)
+            return
+        
+        while True:
+            chunk = read1(STREAM_READ_SIZE, decode_content=True)
+            if not chunk:
+                return
+            yield chunk
+    
+    @staticmethod
+    def _parse_json_line(line: bytearray) -> Optional[Dict[str, Any]]:
+        """Parse one line of a streaming response, or return None to skip it."""
+        # Ollama sends bare NDJSON, so one byte compare settles the common case
+        if line[:1] != b"{":
+            if not line.startswith(b"data: "):
+                return None
+            line = line[6:]  # Remove 'data: ' prefix
+            if line[:1] != b"{":
+                return None
+        
+        # The prefix check above filters blank lines and keep-alives, so the
+        # handler only runs for genuinely malformed objects
+        try:
+            return _json_loads(line)
+        except json.JSONDecodeError as e:
+            logger.debug("Failed to parse JSON line: %r. Error: %s", line, e)
+            return None
+    
     def _process_stream(self, response: requests.Response) -> Iterator[str]:
         """
         Process streaming response and extract tokens.
@@ -168,30 +264,18 @@ class EnhancedLLMClient:
             str: Individual tokens
         """
         try:
-            for line in response.iter_lines():
-                if not line:
-                    continue
-                line = line.decode("utf-8")  # decode bytes to str
-                if line.startswith("data: "):
-                    line = line[6:]  # Remove 'data: ' prefix
+            for data in self._iter_json_lines(response):
+                token = data.get("message", {}).get("content", "")
+                if token:
+                    yield token
                 
-                try:
-                    data = json.loads(line)
-                    token = data.get("message", {}).get("content", "")
-                    if token:
-                        yield token
-                        
-                    # Check for completion
-                    if data.get("done", False):
-                        logger.debug("Stream completed successfully")
-                        break
-                        
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse JSON line: {line}. Error: {e}")
-                    continue
+                # Check for completion
+                if data.get("done", False):
+                    logger.debug("Stream completed successfully")
+                    break
                     
         except Exception as e:
-            logger.error(f"Error processing stream: {e}")
+            logger.error("Error processing stream: %s", e)
             raise LLMResponseError(f"Stream processing error: {e}")
     
     def stream_code_review(self, code: str) -> Iterator[str]:
@@ -211,10 +295,10 @@ class EnhancedLLMClient:
         max_code_length = config.max_conversation_length // 2
         if len(code) > max_code_length:
             code = code[:max_code_length] + "\n\n# ... (truncated for length) ..."
-            logger.warning(f"Code truncated to {max_code_length} characters")
+            logger.warning("Code truncated to %d characters", max_code_length)
         
         payload = self._create_review_payload(code)
-        logger.info(f"Starting code review stream for {len(code)} characters of code")
+        logger.info("Starting code review stream for %d characters of code", len(code))
         
         yield from self._stream_response(payload)
     
@@ -235,12 +319,18 @@ class EnhancedLLMClient:
         # Truncate conversation if too long
         max_review_length = config.max_conversation_length // 2
         if len(original_review) > max_review_length:
-            # Keep the end of the review (more recent context)
-            original_review = "...\n\n" + original_review[-max_review_length:]
-            logger.warning(f"Review truncated to {max_review_length} characters")
+            # Keep the start fixed so consecutive follow-ups share a prompt
+            # prefix that Ollama can reuse from its cache, and spend the rest
+            # on the end of the review (more recent context)
+            head_length = max_review_length // 2
+            original_review = (
+                original_review[:head_length] + "\n\n...\n\n"
+                + original_review[-(max_review_length - head_length):]
+            )
+            logger.warning("Review truncated to %d characters", max_review_length)
         
         payload = self._create_followup_payload(original_review, question)
-        logger.info(f"Starting follow-up stream for question: {question[:50]}...")
+        logger.info("Starting follow-up stream for question: %s...", question[:50])
         
         yield from self._stream_response(payload)
     
@@ -251,16 +341,21 @@ class EnhancedLLMClient:
         Returns:
             bool: True if connection successful
         """
+        # A recent success is reused; failures are always re-checked
+        if time.monotonic() < self._conn_ok_until:
+            return True
+        
         try:
             response = self.session.get(
-                self.api_url.replace('/api/chat', '/api/tags'),
+                self._tags_url,
                 timeout=5.0
             )
             response.raise_for_status()
             logger.info("LLM connection test successful")
+            self._conn_ok_until = time.monotonic() + CONNECTION_OK_TTL_S
             return True
         except Exception as e:
-            logger.error(f"LLM connection test failed: {e}")
+            logger.error("LLM connection test failed: %s", e)
             return False
 
 
@@ -5,16 +5,30 @@ This module provides thread-safe task execution for LLM reviews with
 optimized streaming and buffering using C++ backend when available.
 """
 
+import time
 import logging
-from typing import Optional, Callable
+import threading
+from array import array
+from collections import deque
+from typing import Optional, Callable, Deque, Iterable, List
 from PyQt6.QtCore import QObject, pyqtSignal, QRunnable, QTimer
-from PyQt6.QtWidgets import QApplication
 
 from llm_interface.qwen_runner import stream_code_review, stream_follow_up, LLMError
 from config.app_config import config
 
 logger = logging.getLogger(__name__)
 
+# The Python fallback flushes early once this many characters are buffered
+MAX_BUFFERED_CHARS = 4096
+
+# Progress updates after the first one back off by doubling the token gap,
+# up to this many tokens between updates
+MAX_PROGRESS_STEP = 512
+
+# Cancellation is checked once per this many tokens (a power of two); the
+# batch flushed in between is dropped by the Python fallback
+CANCEL_CHECK_INTERVAL = 64
+
 try:
     import core_performance
     HAS_CPP_BACKEND = True
@@ -39,6 +53,35 @@ class ReviewWorkerSignals(QObject):
     progress = pyqtSignal(str)
 
 
+# Finished tasks return their signal objects here for reuse; acquired on the
+# GUI thread, released on worker threads
+_SIGNALS_POOL_SIZE = 8
+_signals_pool: List[ReviewWorkerSignals] = []
+_signals_pool_lock = threading.Lock()
+
+
+def _acquire_signals() -> ReviewWorkerSignals:
+    """Get a disconnected signals object, reusing a pooled one if available."""
+    with _signals_pool_lock:
+        if _signals_pool:
+            return _signals_pool.pop()
+    return ReviewWorkerSignals()
+
+
+def _release_signals(signals: ReviewWorkerSignals) -> None:
+    """Disconnect a signals object and return it to the pool."""
+    for signal in (signals.content_ready, signals.finished,
+                   signals.error, signals.progress):
+        try:
+            signal.disconnect()
+        except TypeError:
+            pass  # No connections left
+    
+    with _signals_pool_lock:
+        if len(_signals_pool) < _SIGNALS_POOL_SIZE:
+            _signals_pool.append(signals)
+
+
 class BaseReviewTask(QRunnable):
     """
     Base class for review tasks with enhanced streaming capabilities.
@@ -46,10 +89,20 @@ class BaseReviewTask(QRunnable):
     
     def __init__(self):
         super().__init__()
-        self.signals = ReviewWorkerSignals()
-        self._is_cancelled = False
+        self.signals = _acquire_signals()
+        self._cancel_event = threading.Event()
         self._streamer: Optional[object] = None
         
+        # Content flushed by the C++ streamer; appended on its flush thread
+        # and drained by the GUI thread, relying on deque's atomic
+        # append/popleft
+        self.content_queue: Deque[str] = deque()
+        
+        # Bound to the streamer's add_token or the Python fallback below, so
+        # the per-token path does no backend dispatch. Cancellation is
+        # checked by _consume_stream, not per token.
+        self._add_token: Callable[[str], None]
+        
         # Initialize C++ streamer if available
         if HAS_CPP_BACKEND:
             self._setup_cpp_streamer()
@@ -64,47 +117,50 @@ class BaseReviewTask(QRunnable):
                 flush_interval_ms=config.flush_interval_ms
             )
             
-            # Set up callback to emit content to main thread
-            def content_callback(content: str):
-                if not self._is_cancelled:
-                    # Use QApplication.postEvent for thread-safe signal emission
-                    QApplication.postEvent(
-                        self.signals,
-                        ContentReadyEvent(content)
-                    )
-            
-            self._streamer.set_update_callback(content_callback)
+            # Batches are queued for the main window to drain on its flush
+            # timer rather than posted to the GUI event loop one by one
+            self._streamer.set_update_callback(self.content_queue.append)
+            self._add_token = self._streamer.add_token
             logger.debug("C++ streamer initialized successfully")
             
         except Exception as e:
-            logger.warning(f"Failed to initialize C++ streamer: {e}. Using Python fallback.")
+            logger.warning("Failed to initialize C++ streamer: %s. Using Python fallback.", e)
+            self._streamer = None
             self._setup_python_fallback()
     
     def _setup_python_fallback(self):
         """Setup Python fallback for token streaming."""
         self._buffer = []
-        self._buffer_size = config.buffer_size
-        logger.debug("Using Python fallback for token streaming")
-    
-    def _add_token(self, token: str):
-        """Add a token to the stream buffer."""
-        if self._is_cancelled:
-            return
+        self._buffer_chars = 0
+        self._flush_interval = config.flush_interval_ms / 1000.0
+        self._last_flush = time.monotonic()
         
-        if HAS_CPP_BACKEND and self._streamer:
-            self._streamer.add_token(token)
-        else:
-            # Python fallback
-            self._buffer.append(token)
-            if len(self._buffer) >= self._buffer_size:
-                self._flush_python_buffer()
+        append = self._buffer.append
+        flush = self._flush_python_buffer
+        monotonic = time.monotonic
+        interval = self._flush_interval
+        
+        def add_token(token: str):
+            # Like the C++ streamer, emit at most once per flush interval
+            # unless a large batch has built up
+            append(token)
+            self._buffer_chars += len(token)
+            if (self._buffer_chars >= MAX_BUFFERED_CHARS
+                    or monotonic() - self._last_flush >= interval):
+                flush()
+        
+        self._add_token = add_token
+        logger.debug("Using Python fallback for token streaming")
     
     def _flush_python_buffer(self):
         """Flush the Python token buffer."""
         if self._buffer:
             content = ''.join(self._buffer)
             self._buffer.clear()
-            self.signals.content_ready.emit(content)
+            self._buffer_chars = 0
+            self._last_flush = time.monotonic()
+            if not self._cancel_event.is_set():
+                self.signals.content_ready.emit(content)
     
     def _start_streaming(self):
         """Start the streaming process."""
@@ -121,10 +177,77 @@ class BaseReviewTask(QRunnable):
     
     def cancel(self):
         """Cancel the current task."""
-        self._is_cancelled = True
+        self._cancel_event.set()
         if HAS_CPP_BACKEND and self._streamer:
             self._streamer.stop_streaming()
-        logger.info(f"Task {self.__class__.__name__} cancelled")
+        logger.info("Task %s cancelled", self.__class__.__name__)
+    
+    def _consume_stream(self, tokens: Iterable[str], first_progress_at: int,
+                        progress_message: str, prefix: str = "") -> Optional[int]:
+        """
+        Feed streamed tokens into the stream buffer until the stream ends.
+        
+        Args:
+            tokens: Token iterator from the LLM
+            first_progress_at: Token count of the first progress update; the
+                gap to each following update doubles, up to MAX_PROGRESS_STEP
+            progress_message: Progress text, formatted with the token count
+            prefix: Text to emit ahead of the first token, in the same batch
+        
+        Returns:
+            Optional[int]: Number of tokens consumed, or None if the task was
+            cancelled
+        
+        Raises:
+            LLMError: Stream failures surface as exceptions from the
+                generator, so tokens need no in-band error check
+        """
+        add_token = self._add_token
+        emit_progress = self.signals.progress.emit
+        is_cancelled = self._cancel_event.is_set
+        cancel_mask = CANCEL_CHECK_INTERVAL - 1
+        token_count = 0
+        progress_step = first_progress_at
+        countdown = progress_step
+        
+        # The first token can take a while as the model starts up, so
+        # cancellation is checked as soon as it arrives. The prefix is held
+        # until then so it is not flushed, and rendered, on its own.
+        tokens = iter(tokens)
+        first_token = next(tokens, "")
+        if is_cancelled():
+            logger.info("%s cancelled during execution", self.__class__.__name__)
+            return None
+        if prefix or first_token:
+            add_token(prefix + first_token)
+        if first_token:
+            token_count = 1
+            countdown -= 1
+        
+        for token in tokens:
+            add_token(token)
+            token_count += 1
+            
+            if not token_count & cancel_mask and is_cancelled():
+                logger.info("%s cancelled during execution", self.__class__.__name__)
+                return None
+            
+            # Progress updates, increasingly sparse as the stream goes on.
+            # They are rare enough to check cancellation before each one, so
+            # a cancelled task never reports progress over its successor's.
+            countdown -= 1
+            if not countdown:
+                if is_cancelled():
+                    logger.info("%s cancelled during execution", self.__class__.__name__)
+                    return None
+                progress_step = min(progress_step * 2, MAX_PROGRESS_STEP)
+                countdown = progress_step
+                emit_progress(progress_message.format(token_count))
+        
+        if is_cancelled():
+            logger.info("%s cancelled during execution", self.__class__.__name__)
+            return None
+        return token_count
     
     def run(self):
         """Execute the task. To be implemented by subclasses."""
@@ -137,7 +260,7 @@ class ReviewTask(BaseReviewTask):
     def __init__(self, code: str):
         super().__init__()
         self.code = code
-        logger.info(f"Created ReviewTask for {len(code)} characters of code")
+        logger.info("Created ReviewTask for %d characters of code", len(code))
     
     def run(self):
         """Execute the code review task."""
@@ -149,39 +272,31 @@ class ReviewTask(BaseReviewTask):
             self.signals.progress.emit("Starting code review...")
             self._start_streaming()
             
-            # Stream tokens from LLM
-            token_count = 0
-            for token in stream_code_review(self.code):
-                if self._is_cancelled:
-                    logger.info("ReviewTask cancelled during execution")
-                    return
-                
-                if token.startswith("[ERROR]"):
-                    self.signals.error.emit(token)
-                    return
-                
-                self._add_token(token)
-                token_count += 1
-                
-                # Periodic progress updates
-                if token_count % 50 == 0:
-                    self.signals.progress.emit(f"Received {token_count} tokens...")
-            
-            # Ensure all content is flushed
-            self._stop_streaming()
+            # Stream tokens from LLM. Flush what was received even if the
+            # stream fails, ahead of the finished or error signal, since the
+            # window stops draining streamed content once either arrives.
+            try:
+                token_count = self._consume_stream(
+                    stream_code_review(self.code), 50, "Received {} tokens..."
+                )
+            finally:
+                self._stop_streaming()
+            if token_count is None:
+                return
             
             self.signals.progress.emit("Code review completed")
             self.signals.finished.emit()
-            logger.info(f"ReviewTask completed successfully with {token_count} tokens")
+            logger.info("ReviewTask completed successfully with %d tokens", token_count)
             
         except LLMError as e:
-            logger.error(f"LLM error in ReviewTask: {e}")
+            logger.error("LLM error in ReviewTask: %s", e)
             self.signals.error.emit(f"LLM Error: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error in ReviewTask: {e}")
+            logger.error("Unexpected error in ReviewTask: %s", e)
             self.signals.error.emit(f"Unexpected error: {e}")
         finally:
             self._stop_streaming()
+            _release_signals(self.signals)
 
 
 class FollowUpTask(BaseReviewTask):
@@ -191,7 +306,7 @@ class FollowUpTask(BaseReviewTask):
         super().__init__()
         self.original_review = original_review
         self.question = question
-        logger.info(f"Created FollowUpTask for question: {question[:50]}...")
+        logger.info("Created FollowUpTask for question: %s...", question[:50])
     
     def run(self):
         """Execute the follow-up question task."""
@@ -203,42 +318,32 @@ class FollowUpTask(BaseReviewTask):
             self.signals.progress.emit("Processing follow-up question...")
             self._start_streaming()
             
-            # Add separator for follow-up content
-            self._add_token(f"\n\n---\n\n**Follow-up:** {self.question}\n\n")
-            
-            # Stream tokens from LLM
-            token_count = 0
-            for token in stream_follow_up(self.original_review, self.question):
-                if self._is_cancelled:
-                    logger.info("FollowUpTask cancelled during execution")
-                    return
-                
-                if token.startswith("[ERROR]"):
-                    self.signals.error.emit(token)
-                    return
-                
-                self._add_token(token)
-                token_count += 1
-                
-                # Periodic progress updates
-                if token_count % 30 == 0:
-                    self.signals.progress.emit(f"Processing response... ({token_count} tokens)")
-            
-            # Ensure all content is flushed
-            self._stop_streaming()
+            # Stream tokens from LLM, after a separator for follow-up content;
+            # flushed even on failure, as in ReviewTask.run
+            try:
+                token_count = self._consume_stream(
+                    stream_follow_up(self.original_review, self.question),
+                    30, "Processing response... ({} tokens)",
+                    prefix=f"\n\n---\n\n**Follow-up:** {self.question}\n\n"
+                )
+            finally:
+                self._stop_streaming()
+            if token_count is None:
+                return
             
             self.signals.progress.emit("Follow-up completed")
             self.signals.finished.emit()
-            logger.info(f"FollowUpTask completed successfully with {token_count} tokens")
+            logger.info("FollowUpTask completed successfully with %d tokens", token_count)
             
         except LLMError as e:
-            logger.error(f"LLM error in FollowUpTask: {e}")
+            logger.error("LLM error in FollowUpTask: %s", e)
             self.signals.error.emit(f"LLM Error: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error in FollowUpTask: {e}")
+            logger.error("Unexpected error in FollowUpTask: %s", e)
             self.signals.error.emit(f"Unexpected error: {e}")
         finally:
             self._stop_streaming()
+            _release_signals(self.signals)
 
 
 class TaskManager:
@@ -246,9 +351,14 @@ class TaskManager:
     Manager for coordinating multiple review tasks.
     """
     
+    __slots__ = ('current_task', '_review_sizes', '_followup_sizes')
+    
     def __init__(self):
         self.current_task: Optional[BaseReviewTask] = None
-        self.task_history = []
+        
+        # Input sizes of started tasks, one compact array per task type
+        self._review_sizes = array('Q')
+        self._followup_sizes = array('Q')
     
     def start_review(self, code: str, signals_target) -> ReviewTask:
         """Start a new review task."""
@@ -257,7 +367,7 @@ class TaskManager:
         task = ReviewTask(code)
         self._connect_signals(task, signals_target)
         self.current_task = task
-        self.task_history.append(('review', len(code)))
+        self._review_sizes.append(len(code))
         
         return task
     
@@ -268,7 +378,7 @@ class TaskManager:
         task = FollowUpTask(original_review, question)
         self._connect_signals(task, signals_target)
         self.current_task = task
-        self.task_history.append(('followup', len(question)))
+        self._followup_sizes.append(len(question))
         
         return task
     
@@ -287,22 +397,12 @@ class TaskManager:
     
     def get_stats(self) -> dict:
         """Get statistics about task execution."""
+        reviews = len(self._review_sizes)
+        followups = len(self._followup_sizes)
         return {
-            'total_tasks': len(self.task_history),
-            'reviews': sum(1 for task_type, _ in self.task_history if task_type == 'review'),
-            'followups': sum(1 for task_type, _ in self.task_history if task_type == 'followup'),
+            'total_tasks': reviews + followups,
+            'reviews': reviews,
+            'followups': followups,
             'has_current_task': self.current_task is not None
         }
 
-
-# Custom event for thread-safe content updates
-from PyQt6.QtCore import QEvent
-
-class ContentReadyEvent(QEvent):
-    """Custom event for content ready notifications."""
-    
-    EVENT_TYPE = QEvent.Type(QEvent.registerEventType())
-    
-    def __init__(self, content: str):
-        super().__init__(self.EVENT_TYPE)
-        self.content = content
\ No newline at end of file
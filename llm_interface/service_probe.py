@@ -0,0 +1,50 @@
+"""
+Background availability probe for the Ollama service.
+
+This module checks whether the LLM service is reachable on a worker thread
+so that the main window can be shown without waiting on the network.
+"""
+
+import logging
+from PyQt6.QtCore import QObject, pyqtSignal, QRunnable
+
+from config.app_config import config
+
+logger = logging.getLogger(__name__)
+
+
+class ProbeSignals(QObject):
+    """Signals for reporting probe results to the main thread."""
+
+    # Emitted with the list of warnings collected by the probe
+    finished = pyqtSignal(list)
+
+
+class OllamaProbeTask(QRunnable):
+    """Task that checks whether the Ollama service is available."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = ProbeSignals()
+
+    def run(self):
+        """Probe the Ollama tags endpoint and emit any warnings."""
+        warnings = []
+
+        try:
+            # (connect, read) timeouts
+            response = config.http_session.get(
+                config.ollama_api_url.replace('/api/chat', '/api/tags'),
+                timeout=(0.5, 1.5)
+            )
+            if response.status_code == 200:
+                logger.info("Ollama service is available")
+            else:
+                warnings.append("Ollama service is not responding properly")
+        except Exception:
+            warnings.append(
+                "Could not connect to Ollama service. "
+                "Please ensure Ollama is installed and running with 'ollama run qwen2.5-coder'"
+            )
+
+        self.signals.finished.emit(warnings)
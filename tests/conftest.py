@@ -0,0 +1,7 @@
+"""Shared pytest configuration."""
+
+import os
+import sys
+
+# Make the application packages importable when pytest runs from any directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
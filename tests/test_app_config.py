@@ -0,0 +1,47 @@
+"""Tests for saving the application configuration."""
+
+import json
+import os
+
+import pytest
+
+from config.app_config import ApplicationConfig
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"window_width": 1000}))
+    return path
+
+
+def test_save_writes_config(config_path):
+    cfg = ApplicationConfig(str(config_path))
+    cfg.set("window_width", 1400)
+    cfg.save()
+    
+    assert json.loads(config_path.read_text())["window_width"] == 1400
+    assert not os.path.exists(f"{config_path}.tmp")
+
+
+def test_failed_replace_removes_tmp_file(config_path, monkeypatch):
+    cfg = ApplicationConfig(str(config_path))
+    cfg.set("window_width", 1400)
+    
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(os, "replace", failing_replace)
+    cfg.save()
+    
+    assert not os.path.exists(f"{config_path}.tmp")
+    assert json.loads(config_path.read_text())["window_width"] == 1000
+
+
+def test_unserializable_value_keeps_old_config(config_path):
+    cfg = ApplicationConfig(str(config_path))
+    cfg.set("window_width", object())
+    cfg.save()
+    
+    assert not os.path.exists(f"{config_path}.tmp")
+    assert json.loads(config_path.read_text())["window_width"] == 1000
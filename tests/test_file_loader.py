@@ -0,0 +1,79 @@
+"""Tests for the caching file loader."""
+
+import os
+
+import pytest
+
+from gui.file_loader import FileLoader, FileLoadError
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text("x = 1\n")
+    return path
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_unchanged_file_is_served_from_cache(source):
+    loader = FileLoader()
+    assert loader.load(str(source)) == "x = 1\n"
+    
+    # Rewrite the content but restore the recorded mtime and size
+    st = os.stat(source)
+    source.write_text("y = 2\n")
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert loader.load(str(source)) == "x = 1\n"
+
+
+def test_mtime_change_invalidates_cache(source):
+    loader = FileLoader()
+    loader.load(str(source))
+    
+    # Same size, so only the modification time tells them apart
+    source.write_text("y = 2\n")
+    _bump_mtime(source)
+    assert loader.load(str(source)) == "y = 2\n"
+
+
+def test_size_change_invalidates_cache(source):
+    loader = FileLoader()
+    loader.load(str(source))
+    
+    st = os.stat(source)
+    source.write_text("x = 1\ny = 2\n")
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert loader.load(str(source)) == "x = 1\ny = 2\n"
+
+
+def test_equivalent_paths_share_an_entry(source, monkeypatch):
+    loader = FileLoader()
+    loader.load(str(source))
+    monkeypatch.chdir(source.parent)
+    loader.load(os.path.join(".", source.name))
+    assert loader.get_cache_info()['cached_files'] == [str(source)]
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    loader = FileLoader(max_cache_size=2)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.py"
+        path.write_text(f"{name} = 1\n")
+        paths.append(str(path))
+    
+    loader.load(paths[0])
+    loader.load(paths[1])
+    loader.load(paths[0])
+    loader.load(paths[2])
+    assert loader._cached_stat(paths[0]) is not None
+    assert loader._cached_stat(paths[1]) is None
+
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileLoadError):
+        FileLoader().load(str(tmp_path / "missing.py"))
@@ -0,0 +1,81 @@
+"""Tests for parsing streamed LLM responses."""
+
+import pytest
+
+from llm_interface.qwen_runner import EnhancedLLMClient
+
+
+class _FakeRaw:
+    """Raw body whose read1 returns the given chunks one by one."""
+    
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+    
+    def read1(self, size=-1, decode_content=True):
+        return self._chunks.pop(0) if self._chunks else b""
+
+
+class _FakeResponse:
+    """Streaming response serving the given body chunks."""
+    
+    def __init__(self, chunks, read1=True):
+        self._chunks = list(chunks)
+        self.raw = _FakeRaw(chunks) if read1 else object()
+    
+    def iter_content(self, chunk_size=None):
+        yield from self._chunks
+
+
+@pytest.fixture
+def client():
+    return EnhancedLLMClient()
+
+
+def _lines(client, chunks, read1=True):
+    return list(client._iter_json_lines(_FakeResponse(chunks, read1)))
+
+
+@pytest.mark.parametrize("read1", [True, False])
+def test_objects_split_across_chunks(client, read1):
+    chunks = [b'{"a": 1}\n{"b"', b': 2}\n', b'{"c": 3}\n']
+    assert _lines(client, chunks, read1) == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+
+def test_one_byte_chunks(client):
+    body = b'{"message": {"content": "hi"}}\n{"done": true}\n'
+    chunks = [body[i:i + 1] for i in range(len(body))]
+    assert _lines(client, chunks) == [{"message": {"content": "hi"}}, {"done": True}]
+
+
+def test_data_prefixed_lines(client):
+    chunks = [b'data: {"a": 1}\n', b'{"b": 2}\ndata: [DONE]\n']
+    assert _lines(client, chunks) == [{"a": 1}, {"b": 2}]
+
+
+def test_garbage_and_blank_lines_are_skipped(client):
+    chunks = [b'\n', b'not json\n{"a": \n', b'{"a": 1}\n', b'data: \n', b': ping\n']
+    assert _lines(client, chunks) == [{"a": 1}]
+
+
+def test_unterminated_last_line(client):
+    assert _lines(client, [b'{"a": 1}\n{"b":', b' 2}']) == [{"a": 1}, {"b": 2}]
+
+
+def test_unterminated_garbage_last_line(client):
+    assert _lines(client, [b'{"a": 1}\n{"b": 2']) == [{"a": 1}]
+
+
+def test_empty_body(client):
+    assert _lines(client, []) == []
+
+
+@pytest.mark.parametrize("line, expected", [
+    (bytearray(b'{"a": 1}'), {"a": 1}),
+    (bytearray(b'data: {"a": 1}'), {"a": 1}),
+    (bytearray(b''), None),
+    (bytearray(b'data: [DONE]'), None),
+    (bytearray(b'{broken'), None),
+    (bytearray(b'[1, 2]'), None),
+])
+def test_parse_json_line(line, expected):
+    assert EnhancedLLMClient._parse_json_line(line) == expected